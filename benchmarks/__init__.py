@@ -0,0 +1,32 @@
+"""Benchmarks.
+
+Each module can be run on its own, for example::
+
+    python -m benchmarks.storage
+
+"""
+
+from __future__ import print_function
+
+import timeit
+
+
+def measure(statement, number=100000, repeat=3, **namespace):
+    """Return best time (in microseconds) of single `statement` execution."""
+    timer = timeit.Timer(statement, globals=namespace)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def report(title, results):
+    """Print results of benchmark.
+
+    :param str title: Title of benchmark.
+    :param list results: List of 2-tuples with name and measured value.
+
+    """
+    print(title)
+    print('-' * len(title))
+    for name, value in results:
+        print('{:<48} {:>12.3f}'.format(name, value))
+    print()
@@ -0,0 +1,27 @@
+"""Compare creating models with and without validation."""
+
+from __future__ import print_function
+
+from . import measure, report
+from .to_struct import Shop, build_shop
+
+
+def main():
+    results = []
+    for orders, items in [(100, 10), (1000, 10)]:
+        data = build_shop(orders, items).to_struct()
+        number = max(1, 1000 // orders)
+        title = '{} orders of {} items'.format(orders, items)
+        for name, statement in [
+                ('Shop(**data)', 'Shop(**data)'),
+                ('Shop.from_struct(data)', 'Shop.from_struct(data)'),
+                ('Shop.construct(**data)', 'Shop.construct(**data)')]:
+            results.append((
+                '{}, {}'.format(name, title),
+                measure(statement, number=number, Shop=Shop,
+                        data=data) / 1000))
+    report('Creating models with and without validation (ms)', results)
+
+
+if __name__ == '__main__':
+    main()
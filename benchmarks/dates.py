@@ -0,0 +1,62 @@
+"""Compare parsing of timestamps with fast path, `dateutil` and cache."""
+
+from __future__ import print_function
+
+import datetime
+import timeit
+
+from dateutil.parser import parse
+
+from jsonmodels import fields
+
+from . import report
+
+AMOUNT = 1000000
+
+
+def _timestamps(amount):
+    start = datetime.datetime(2014, 1, 1)
+    step = datetime.timedelta(seconds=7, microseconds=1234)
+    return [
+        (start + step * index).isoformat() + '+02:00'
+        for index in range(amount)]
+
+
+def _parse_all(parse_value, timestamps):
+    for timestamp in timestamps:
+        parse_value(timestamp)
+
+
+def _measure(candidates, timestamps):
+    results = []
+    for name, parse_value in candidates:
+        seconds = timeit.timeit(
+            lambda: _parse_all(parse_value, timestamps), number=1)
+        results.append((name, seconds))
+    return results
+
+
+def main():
+    timestamps = _timestamps(AMOUNT)
+    report('Parsing of {} timestamps (s)'.format(AMOUNT), _measure([
+        ('DateTimeField', fields.DateTimeField().parse_value),
+        ('DateTimeField, strict', fields.DateTimeField(
+            strict=True).parse_value),
+        ('dateutil', parse),
+    ], timestamps))
+
+    distinct = _timestamps(1000)
+    repeated = [distinct[index % 1000] for index in range(AMOUNT)]
+    report(
+        'Parsing of {} timestamps, 1000 distinct (s)'.format(AMOUNT),
+        _measure([
+            ('DateTimeField', fields.DateTimeField().parse_value),
+            ('DateTimeField, cache=1024', fields.DateTimeField(
+                cache=1024).parse_value),
+            ('DateTimeField, cache=100', fields.DateTimeField(
+                cache=100).parse_value),
+        ], repeated))
+
+
+if __name__ == '__main__':
+    main()
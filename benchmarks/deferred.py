@@ -0,0 +1,85 @@
+"""Compare building models field by field with and without deferred
+validation."""
+
+from __future__ import print_function
+
+from jsonmodels import models, fields, validators
+
+from . import measure, report
+
+
+class Item(models.Base):
+
+    name = fields.StringField(
+        required=True, validators=validators.Length(1, 100))
+    price = fields.FloatField(validators=validators.Min(0))
+    quantity = fields.IntField(validators=validators.Min(1))
+    tags = fields.ListField(str)
+
+
+class Order(models.Base):
+
+    number = fields.IntField(required=True, validators=validators.Min(0))
+    customer = fields.StringField(validators=validators.Length(1, 100))
+    paid = fields.BoolField()
+    items = fields.ListField(Item)
+
+
+class DeferredItem(Item):
+
+    class Meta:
+        deferred_validation = True
+
+
+class DeferredOrder(Order):
+
+    items = fields.ListField(DeferredItem)
+
+    class Meta:
+        deferred_validation = True
+
+
+def build(order_class, item_class, items):
+    """Build order step by step (as transformation code does) and cast it."""
+    order = order_class()
+    order.number = 1
+    order.customer = 'Alan'
+    for index in range(items):
+        item = item_class()
+        item.name = 'item'
+        item.price = 1.5 * index
+        item.quantity = index + 1
+        item.tags = ['a', 'b']
+        order.items.append(item)
+    order.paid = True
+    return order.to_struct()
+
+
+def build_deferred(order_class, item_class, items):
+    with fields.deferred_validation():
+        return build(order_class, item_class, items)
+
+
+def main():
+    results = []
+    for items in (10, 100):
+        title = 'order of {} items'.format(items)
+        namespace = dict(
+            build=build, build_deferred=build_deferred, Order=Order,
+            Item=Item, DeferredOrder=DeferredOrder,
+            DeferredItem=DeferredItem, items=items)
+        number = 10000 // items
+        for name, statement in [
+                ('validated', 'build(Order, Item, items)'),
+                ('deferred_validation()',
+                    'build_deferred(Order, Item, items)'),
+                ('deferred_validation option',
+                    'build(DeferredOrder, DeferredItem, items)')]:
+            results.append((
+                '{}, {}'.format(name, title),
+                measure(statement, number=number, **namespace)))
+    report('Building and casting order (us)', results)
+
+
+if __name__ == '__main__':
+    main()
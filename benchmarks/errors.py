@@ -0,0 +1,34 @@
+"""Measure raising and catching validation errors (as code trying
+alternatives does)."""
+
+from __future__ import print_function
+
+from jsonmodels import errors, fields, validators
+
+from . import measure, report
+
+
+def probe(validate, value):
+    try:
+        validate(value)
+    except errors.ValidationError:
+        pass
+
+
+def main():
+    results = []
+    for name, validate, value in [
+            ('wrong type', fields.IntField().validate, 'text'),
+            ('wrong items type',
+                fields.ListField([int, float, bool]).validate, ['text']),
+            ('value out of range', validators.Min(0).validate, -1),
+            ('value not allowed',
+                validators.Value(list(range(1000))).validate, -1)]:
+        results.append((name, measure(
+            'probe(validate, value)', probe=probe, validate=validate,
+            value=value)))
+    report('Raising and catching validation error (us)', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Compare creating models from JSON in two steps and with compiled loaders."""
+
+from __future__ import print_function
+
+import json
+
+from . import measure, report
+from .to_struct import Shop, build_chain, build_shop, Node
+
+
+def main():
+    results = []
+    for orders, items in [(100, 10), (1000, 10)]:
+        text = build_shop(orders, items).to_json()
+        number = max(1, 1000 // orders)
+        title = '{} orders of {} items'.format(orders, items)
+        results.append((
+            'Shop(**json.loads(text)), ' + title,
+            measure('Shop(**loads(text))', number=number, Shop=Shop,
+                    loads=json.loads, text=text) / 1000))
+        results.append((
+            'Shop.from_json(text), ' + title,
+            measure('Shop.from_json(text)', number=number, Shop=Shop,
+                    text=text) / 1000))
+
+    text = build_chain(100).to_json()
+    results.append((
+        'Node(**json.loads(text)), depth 100',
+        measure('Node(**loads(text))', number=100, Node=Node,
+                loads=json.loads, text=text) / 1000))
+    results.append((
+        'Node.from_json(text), depth 100',
+        measure('Node.from_json(text)', number=100, Node=Node,
+                text=text) / 1000))
+    report('Creating models from JSON (ms)', results)
+
+
+if __name__ == '__main__':
+    main()
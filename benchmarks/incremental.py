@@ -0,0 +1,69 @@
+"""Compare full and incremental validation of large model, after one of its
+fields changed."""
+
+from __future__ import print_function
+
+from jsonmodels import models, fields, validators
+
+from . import measure, report
+
+
+class Item(models.Base):
+
+    name = fields.StringField(
+        required=True, validators=validators.Length(1, 100))
+    price = fields.FloatField(validators=validators.Min(0))
+    quantity = fields.IntField(validators=validators.Min(1))
+
+
+class Order(models.Base):
+
+    number = fields.IntField(required=True, validators=validators.Min(0))
+    customer = fields.StringField(validators=validators.Length(1, 100))
+    items = fields.ListField(Item)
+
+
+class Shop(models.Base):
+
+    name = fields.StringField(required=True)
+    orders = fields.ListField(Order)
+
+
+def build(orders):
+    return Shop(name='shop', orders=[
+        {'number': number, 'customer': 'Alan', 'items': [
+            {'name': 'item', 'price': 1.5, 'quantity': 1}] * 10}
+        for number in range(orders)])
+
+
+def refresh(shop, full, cast):
+    """Tweak single field of shop and validate (or cast) it."""
+    with fields.deferred_validation():
+        shop.orders[0].items[0].price = 2.5
+    if full:
+        fields.forget_validations()
+    if cast:
+        shop.to_struct()
+    else:
+        shop.validate()
+
+
+def main():
+    results = []
+    for orders in (10, 1000):
+        shop = build(orders)
+        shop.validate()
+        title = 'shop with {} orders'.format(orders)
+        for name, statement in [
+                ('full validate', 'refresh(shop, True, False)'),
+                ('incremental validate', 'refresh(shop, False, False)'),
+                ('full to_struct', 'refresh(shop, True, True)'),
+                ('incremental to_struct', 'refresh(shop, False, True)')]:
+            results.append(('{}, {}'.format(name, title), measure(
+                statement, number=10000 // orders, refresh=refresh,
+                shop=shop)))
+    report('Refreshing shop after single change (us)', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare reading and writing JSON Lines in one and many processes."""
+
+from __future__ import print_function
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+from jsonmodels import jsonl
+
+from . import report
+from .to_struct import Order, build_shop
+
+AMOUNT = 100000
+
+
+def _records_per_second(function, *args, **kwargs):
+    start = time.time()
+    function(*args, **kwargs)
+    return AMOUNT / (time.time() - start)
+
+
+def _load_all(path, **options):
+    for _ in jsonl.load(Order, path, **options):
+        pass
+
+
+def main():
+    orders = build_shop(AMOUNT, 3).orders
+    handle, path = tempfile.mkstemp(suffix='.jsonl')
+    os.close(handle)
+
+    results = []
+    try:
+        for workers in sorted(set([0, 2, multiprocessing.cpu_count()])):
+            stats = {}
+            results.append((
+                'dump, workers={}'.format(workers),
+                _records_per_second(
+                    jsonl.dump, orders, path, workers=workers)))
+            results.append((
+                'load, workers={}'.format(workers),
+                _records_per_second(
+                    _load_all, path, workers=workers, stats=stats)))
+            for worker, worker_stats in sorted(stats.items()):
+                results.append((
+                    '    load, worker {}'.format(worker),
+                    worker_stats.throughput))
+    finally:
+        os.remove(path)
+
+    report('JSON Lines with {} orders (records/s)'.format(AMOUNT), results)
+
+
+if __name__ == '__main__':
+    main()
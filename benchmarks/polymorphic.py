@@ -0,0 +1,79 @@
+"""Compare choosing type of embedded model by trying each type and by value
+of discriminator."""
+
+from __future__ import print_function
+
+from jsonmodels import errors, models, fields
+
+from . import measure, report
+
+
+class Car(models.Base):
+
+    brand = fields.StringField(required=True)
+    seats = fields.IntField(required=True)
+
+
+class Bike(models.Base):
+
+    gears = fields.IntField(required=True)
+
+
+class Boat(models.Base):
+
+    length = fields.FloatField(required=True)
+
+
+class Parking(models.Base):
+
+    vehicle = fields.EmbeddedField([Car, Bike, Boat])
+
+
+class DiscriminatedParking(models.Base):
+
+    vehicle = fields.EmbeddedField(
+        {'car': Car, 'bike': Bike, 'boat': Boat}, discriminator='kind')
+
+
+VEHICLES = [
+    {'kind': 'car', 'brand': 'Fiat', 'seats': 5},
+    {'kind': 'bike', 'gears': 3},
+    {'kind': 'boat', 'length': 4.5},
+] * 100
+
+
+def try_each_type(data):
+    """Create model of first type which accepts data."""
+    for model_type in (Car, Bike, Boat):
+        try:
+            model = model_type(**data)
+            model.validate()
+            return model
+        except errors.ValidationError:
+            pass
+    raise errors.ValidationError('No type matches.')
+
+
+def load_trying(vehicles):
+    return [Parking(vehicle=try_each_type(data)) for data in vehicles]
+
+
+def load_discriminated(vehicles):
+    return [
+        DiscriminatedParking.from_struct({'vehicle': data})
+        for data in vehicles]
+
+
+def main():
+    results = []
+    for name, statement in [
+            ('trying each type', 'load_trying(VEHICLES)'),
+            ('discriminator', 'load_discriminated(VEHICLES)')]:
+        results.append((name, measure(
+            statement, number=100, load_trying=load_trying,
+            load_discriminated=load_discriminated, VEHICLES=VEHICLES)))
+    report('Loading 300 polymorphic vehicles (us)', results)
+
+
+if __name__ == '__main__':
+    main()
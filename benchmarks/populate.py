@@ -0,0 +1,37 @@
+"""Compare generic population of models with compiled one."""
+
+from __future__ import print_function
+
+from jsonmodels import models, fields
+
+from . import measure, report
+
+
+def _make_model(name, amount, compiled):
+    attributes = dict(
+        ('field_{}'.format(index), fields.IntField())
+        for index in range(amount))
+    attributes['Meta'] = type('Meta', (object,), {
+        'compile_populate': compiled})
+    return type(name, (models.Base,), attributes)
+
+
+def main():
+    results = []
+    for amount in (5, 40):
+        data = dict(
+            ('field_{}'.format(index), index) for index in range(amount))
+        generic = _make_model('Generic', amount, False)
+        compiled = _make_model('Compiled', amount, True)
+        results.append((
+            'generic, {} fields'.format(amount),
+            measure('cls(**data)', number=20000, cls=generic, data=data)))
+        results.append((
+            'compiled, {} fields'.format(amount),
+            measure('cls(**data)', number=20000, cls=compiled, data=data)))
+
+    report('Model construction (us)', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare validation with many distinct regular expressions."""
+
+from __future__ import print_function
+
+import re
+
+from jsonmodels import validators
+
+from . import measure, report
+
+
+class SearchingRegex(validators.Regex):
+
+    """Regex validator that searches with pattern string (old design)."""
+
+    def validate(self, value):
+        flags = 0
+        for flag in self.flags:
+            flags |= flag
+        if not re.search(self.pattern, value, flags):
+            raise ValueError(value)
+
+
+def _validate_all(regexes, value):
+    for regex in regexes:
+        regex.validate(value)
+
+
+def main():
+    results = []
+    for amount in (50, 5000):
+        patterns = ['^value{}|value$'.format(index) for index in range(amount)]
+        compiled = [validators.Regex(pattern) for pattern in patterns]
+        searching = [SearchingRegex(pattern) for pattern in patterns]
+        number = max(1, 50000 // amount)
+        results.append((
+            'compiled, {} patterns'.format(amount),
+            measure('validate(regexes, "value")', number=number,
+                    validate=_validate_all, regexes=compiled) / amount))
+        results.append((
+            're.search, {} patterns'.format(amount),
+            measure('validate(regexes, "value")', number=number,
+                    validate=_validate_all, regexes=searching) / amount))
+
+    report('Regex validation (us per validation)', results)
+
+
+if __name__ == '__main__':
+    main()
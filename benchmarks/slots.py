@@ -0,0 +1,62 @@
+"""Compare memory used by regular models and by models with slots."""
+
+from __future__ import print_function
+
+import gc
+import tracemalloc
+
+from jsonmodels import models, fields
+
+from . import measure, report
+
+
+class Person(models.Base):
+
+    name = fields.StringField()
+    surname = fields.StringField()
+    age = fields.IntField()
+    cash = fields.FloatField()
+
+
+class SlottedPerson(models.Base):
+
+    name = fields.StringField()
+    surname = fields.StringField()
+    age = fields.IntField()
+    cash = fields.FloatField()
+
+    class Meta:
+        slots = True
+
+
+def _bytes_per_instance(cls, amount):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [
+        cls(name='Alan', surname='Wake', age=index, cash=1.5)
+        for index in range(amount)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return float(after - before) / amount
+
+
+def main():
+    report('Memory (bytes per instance)', [
+        ('regular', _bytes_per_instance(Person, 100000)),
+        ('slots', _bytes_per_instance(SlottedPerson, 100000)),
+    ])
+
+    person = Person(name='Alan')
+    slotted = SlottedPerson(name='Alan')
+    report('Attribute access (us)', [
+        ('regular: get', measure('p.name', p=person)),
+        ('slots: get', measure('p.name', p=slotted)),
+        ('regular: set', measure("p.name = 'x'", p=person)),
+        ('slots: set', measure("p.name = 'x'", p=slotted)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Compare per-instance storage of values with storage kept in fields."""
+
+from __future__ import print_function
+
+import gc
+import tracemalloc
+
+from jsonmodels import models, fields
+
+from . import measure, report
+
+
+class LegacyStringField(fields.StringField):
+
+    """Field that keeps values of all instances in itself (old design)."""
+
+    def __init__(self, *args, **kwargs):
+        super(LegacyStringField, self).__init__(*args, **kwargs)
+        self._memory = {}
+
+    def __set__(self, obj, value):
+        value = self.parse_value(value)
+        self.validate(value)
+        self._memory[obj] = value
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        if obj not in self._memory:
+            self.__set__(obj, self.get_default_value())
+        return self._memory[obj]
+
+
+class Person(models.Base):
+
+    name = fields.StringField()
+    surname = fields.StringField()
+
+
+class LegacyPerson(models.Base):
+
+    name = LegacyStringField()
+    surname = LegacyStringField()
+
+
+def _allocated(cls, amount):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(name='Alan', surname='Wake') for _ in range(amount)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return float(after - before) / amount
+
+
+def _retained(cls, amount):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(amount):
+        cls(name='Alan', surname='Wake')
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return float(after - before) / 2 ** 20
+
+
+def main():
+    person = Person(name='Alan', surname='Wake')
+    legacy = LegacyPerson(name='Alan', surname='Wake')
+
+    report('Attribute access (us)', [
+        ('per-instance storage: get', measure('p.name', p=person)),
+        ('field storage: get', measure('p.name', p=legacy)),
+        ('per-instance storage: set', measure("p.name = 'x'", p=person)),
+        ('field storage: set', measure("p.name = 'x'", p=legacy)),
+    ])
+    report('Memory', [
+        ('per-instance storage: bytes/instance',
+            _allocated(Person, 10000)),
+        ('field storage: bytes/instance', _allocated(LegacyPerson, 10000)),
+        ('per-instance storage: MiB retained after 100k',
+            _retained(Person, 100000)),
+        ('field storage: MiB retained after 100k',
+            _retained(LegacyPerson, 100000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
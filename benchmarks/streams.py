@@ -0,0 +1,69 @@
+"""Compare loading array of models at once and reading it from stream."""
+
+from __future__ import print_function
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from . import report
+from .to_struct import Item, Order
+
+AMOUNT = 100000
+
+
+def _write_orders(stream, amount):
+    order = Order(number=1, customer='Alan', paid=True, items=[
+        Item(name='item', price=1.5, tags=['a', 'b'])
+        for _ in range(3)]).to_json().encode('utf-8')
+    stream.write(b'[' + b',\n'.join([order] * amount) + b']')
+
+
+def _load_at_once(path):
+    with open(path, 'rb') as stream:
+        for data in json.load(stream):
+            Order(**data).validate()
+
+
+def _load_from_stream(path):
+    with open(path, 'rb') as stream:
+        for _ in Order.iter_from_file(stream):
+            pass
+
+
+def _run(function, path):
+    """Return peak of memory (in megabytes) and time (in seconds) of call."""
+    tracemalloc.start()
+    try:
+        start = time.time()
+        function(path)
+        seconds = time.time() - start
+        return tracemalloc.get_traced_memory()[1] / 1024.0 ** 2, seconds
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    handle, path = tempfile.mkstemp(suffix='.json')
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            _write_orders(stream, AMOUNT)
+
+        results = [
+            ('json.load, Order(**data)', _run(_load_at_once, path)),
+            ('Order.iter_from_file', _run(_load_from_stream, path)),
+        ]
+    finally:
+        os.remove(path)
+
+    title = 'Reading {} orders'.format(AMOUNT)
+    report(title + ', peak memory (MB)', [
+        (name, memory) for name, (memory, _) in results])
+    report(title + ' (s)', [
+        (name, seconds) for name, (_, seconds) in results])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare peak memory and time of casting models to JSON."""
+
+from __future__ import print_function
+
+import json
+import os
+import tracemalloc
+
+from . import measure, report
+from .to_struct import build_shop
+
+
+def _dumps(shop):
+    return json.dumps(shop.to_struct())
+
+
+def _dump(shop):
+    with open(os.devnull, 'w') as stream:
+        shop.dump(stream)
+
+
+def _peak_memory(function, *args):
+    """Return peak of memory (in kilobytes) allocated during call."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024.0
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    shop = build_shop(1000, 10)
+    candidates = [
+        ('json.dumps(shop.to_struct())', _dumps),
+        ('shop.to_json()', lambda shop: shop.to_json()),
+        ('shop.dump(fp)', _dump),
+    ]
+    report('Peak memory of casting 10k items tree (kB)', [
+        (name, _peak_memory(function, shop))
+        for name, function in candidates])
+    report('Casting 10k items tree (ms)', [
+        (name, measure('function(shop)', number=5, repeat=3,
+                       function=function, shop=shop) / 1000)
+        for name, function in candidates])
+
+
+if __name__ == '__main__':
+    main()
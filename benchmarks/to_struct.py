@@ -0,0 +1,84 @@
+"""Compare reference and compiled casting of models to Python structures."""
+
+from __future__ import print_function
+
+from jsonmodels import models, fields, parsers
+
+from . import measure, report
+
+
+class Item(models.Base):
+
+    name = fields.StringField(required=True)
+    price = fields.FloatField()
+    tags = fields.ListField(str)
+
+
+class Order(models.Base):
+
+    number = fields.IntField(required=True)
+    customer = fields.StringField()
+    paid = fields.BoolField()
+    items = fields.ListField(Item)
+
+
+class Shop(models.Base):
+
+    name = fields.StringField()
+    orders = fields.ListField(Order)
+
+
+class Node(models.Base):
+
+    name = fields.StringField()
+
+
+Node.child = fields.EmbeddedField(Node)
+Node.children = fields.ListField(Node)
+
+
+def build_chain(depth):
+    """Build chain of embedded models (each with one list item)."""
+    root = parent = Node(name='root')
+    for _ in range(depth):
+        parent.child = Node(name='node')
+        parent.children.append(Node(name='item'))
+        parent = parent.child
+    return root
+
+
+def build_shop(orders, items):
+    """Build shop with given amount of orders and items in each order."""
+    return Shop(name='shop', orders=[
+        Order(number=number, customer='Alan', paid=True, items=[
+            Item(name='item', price=1.5, tags=['a', 'b'])
+            for _ in range(items)])
+        for number in range(orders)])
+
+
+def main():
+    shop = build_shop(100, 10)
+    report('Casting 1k items tree to struct (ms)', [
+        ('reference (parsers.to_struct)',
+            measure('to_struct(shop)', number=20, shop=shop,
+                    to_struct=parsers.to_struct) / 1000),
+        ('compiled (Base.to_struct)',
+            measure('shop.to_struct()', number=20, shop=shop) / 1000),
+    ])
+
+    results = []
+    for depth in (10, 50, 100):
+        chain = build_chain(depth)
+        nodes = 2 * depth + 1
+        results.append((
+            'reference, depth {}'.format(depth),
+            measure('to_struct(chain)', number=20, chain=chain,
+                    to_struct=parsers.to_struct) / nodes))
+        results.append((
+            'compiled, depth {}'.format(depth),
+            measure('chain.to_struct()', number=20, chain=chain) / nodes))
+    report('Casting chain of embedded models (us per model)', results)
+
+
+if __name__ == '__main__':
+    main()
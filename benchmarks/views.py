@@ -0,0 +1,103 @@
+"""Measure views of models: sparse access to wide payloads and random access
+to records in memory-mapped file."""
+
+from __future__ import print_function
+
+import os
+import random
+import tempfile
+import time
+
+from jsonmodels import jsonl, models, fields
+
+from . import measure, report
+from .to_struct import Order, build_shop
+
+AMOUNT = 200000
+WIDTH = 200
+
+
+class Address(models.Base):
+
+    street = fields.StringField()
+    city = fields.StringField()
+
+
+_WIDE_FIELDS = [
+    ('text', fields.StringField, 'text'),
+    ('number', fields.IntField, 42),
+    ('date', fields.DateTimeField, '2014-05-07T12:45:56'),
+    ('address', lambda: fields.EmbeddedField(Address),
+        {'street': 'Main', 'city': 'Springfield'}),
+]
+
+
+def _build_wide_model():
+    attributes = {}
+    data = {}
+    for index in range(WIDTH):
+        prefix, field_type, value = _WIDE_FIELDS[index % len(_WIDE_FIELDS)]
+        name = '{}{}'.format(prefix, index)
+        attributes[name] = field_type()
+        data[name] = value
+    return type('Wide', (models.Base,), attributes), data
+
+
+def _read_three(model):
+    return model.text0, model.number1, model.address3.city
+
+
+def wide_payloads():
+    model, data = _build_wide_model()
+    namespace = dict(Wide=model, data=data, read=_read_three)
+    report('Reading 3 of {} fields of payload (us)'.format(WIDTH), [
+        ('Wide(**data)', measure(
+            'read(Wide(**data))', number=1000, **namespace)),
+        ('Wide.from_struct(data)', measure(
+            'read(Wide.from_struct(data))', number=1000, **namespace)),
+        ('Wide.view(data)', measure(
+            'read(Wide.view(data))', number=1000, **namespace)),
+        ('Wide.view(data), validate()', measure(
+            'Wide.view(data).validate()', number=1000, **namespace)),
+    ])
+
+
+def mapped_records():
+    handle, path = tempfile.mkstemp(suffix='.jsonl')
+    os.close(handle)
+    try:
+        jsonl.dump(build_shop(AMOUNT, 5).orders, path, workers=0)
+        size = os.path.getsize(path)
+
+        start = time.time()
+        records = Order.map_file(path)
+        index_seconds = time.time() - start
+
+        indexes = [random.randrange(AMOUNT) for _ in range(10000)]
+        start = time.time()
+        for index in indexes:
+            records[index].customer
+        access_seconds = time.time() - start
+        records.close()
+
+        start = time.time()
+        orders = list(jsonl.load(Order, path, workers=0))
+        load_seconds = time.time() - start
+        del orders
+    finally:
+        os.remove(path)
+
+    report('{} orders in {:.1f} MB file'.format(AMOUNT, size / 1024.0 ** 2), [
+        ('indexing file (s)', index_seconds),
+        ('random access to one field (us)', access_seconds / 1e4 * 1e6),
+        ('loading whole file (s)', load_seconds),
+    ])
+
+
+def main():
+    wide_payloads()
+    mapped_records()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,3 @@
-
-
 class ModelCollection(list):
 
     """`ModelCollection` is list which validates stored values.
@@ -7,15 +5,131 @@ class ModelCollection(list):
     Validation is made with use of field passed to `__init__` at each point,
     when new value is assigned.
 
+    Collection also remembers if it was changed since it was validated last
+    time (in `changed` attribute), so it is not validated again needlessly.
+
     """
 
     def __init__(self, field):
         self.field = field
+        self.changed = True
 
     def append(self, value):
         self.field.validate_single_value(value)
+        self.changed = True
         super(ModelCollection, self).append(value)
 
     def __setitem__(self, key, value):
         self.field.validate_single_value(value)
+        self.changed = True
         super(ModelCollection, self).__setitem__(key, value)
+
+    def extend(self, values):
+        self.changed = True
+        super(ModelCollection, self).extend(values)
+
+    def insert(self, index, value):
+        self.changed = True
+        super(ModelCollection, self).insert(index, value)
+
+    def pop(self, *args):
+        self.changed = True
+        return super(ModelCollection, self).pop(*args)
+
+    def remove(self, value):
+        self.changed = True
+        super(ModelCollection, self).remove(value)
+
+    def clear(self):
+        self.changed = True
+        super(ModelCollection, self).clear()
+
+    def __delitem__(self, key):
+        self.changed = True
+        super(ModelCollection, self).__delitem__(key)
+
+    def __iadd__(self, values):
+        self.changed = True
+        return super(ModelCollection, self).__iadd__(values)
+
+    def __imul__(self, times):
+        self.changed = True
+        return super(ModelCollection, self).__imul__(times)
+
+
+class ValidatorCollection(list):
+
+    """`ValidatorCollection` is list of validators of field.
+
+    When it is changed, it is assigned to field again, so validation of field
+    (which is compiled) is compiled again with changed validators.
+
+    """
+
+    def __init__(self, field, validators=()):
+        super(ValidatorCollection, self).__init__(validators)
+        self.field = field
+
+    def __reduce__(self):
+        return type(self), (self.field, list(self))
+
+    def _changed(self):
+        self.field.validators = self
+
+    def append(self, validator):
+        super(ValidatorCollection, self).append(validator)
+        self._changed()
+
+    def extend(self, validators):
+        super(ValidatorCollection, self).extend(validators)
+        self._changed()
+
+    def insert(self, index, validator):
+        super(ValidatorCollection, self).insert(index, validator)
+        self._changed()
+
+    def pop(self, *args):
+        validator = super(ValidatorCollection, self).pop(*args)
+        self._changed()
+        return validator
+
+    def remove(self, validator):
+        super(ValidatorCollection, self).remove(validator)
+        self._changed()
+
+    def clear(self):
+        del self[:]
+
+    def reverse(self):
+        super(ValidatorCollection, self).reverse()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super(ValidatorCollection, self).sort(*args, **kwargs)
+        self._changed()
+
+    def __setitem__(self, key, value):
+        super(ValidatorCollection, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(ValidatorCollection, self).__delitem__(key)
+        self._changed()
+
+    def __setslice__(self, start, stop, validators):
+        # Used instead of `__setitem__` for simple slices in Python 2.
+        self[start:stop:None] = validators
+
+    def __delslice__(self, start, stop):
+        # Used instead of `__delitem__` for simple slices in Python 2.
+        del self[start:stop:None]
+
+    def __iadd__(self, validators):
+        super(ValidatorCollection, self).__iadd__(validators)
+        self._changed()
+        return self
+
+    def __imul__(self, times):
+        super(ValidatorCollection, self).__imul__(times)
+        self._changed()
+        return self
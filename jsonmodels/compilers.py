@@ -0,0 +1,455 @@
+"""Compilers of specialized functions for models.
+
+Functions are generated as Python source for concrete model class (so all
+its fields are known upfront) and compiled with `exec`.
+
+"""
+
+from .fields import (
+    BaseField, EmbeddedField, ListField, shallow_validation,
+    is_deferred_validation)
+
+#: If `False`, models are casted to Python structures with reference
+#: implementation (:func:`jsonmodels.parsers.to_struct`), which can be useful
+#: for debugging.
+USE_COMPILED_SERIALIZERS = True
+
+
+def _overrides(field, method_name):
+    """Check if field overrides given method of `BaseField`."""
+    return getattr(type(field), method_name) != getattr(BaseField, method_name)
+
+
+def _overrides_any(cls, base, method_names):
+    return any(
+        getattr(cls, name) != getattr(base, name) for name in method_names)
+
+
+def _uses_dict(fields):
+    return any(field.slot is None for _, field in fields)
+
+
+def _build(name, lines, namespace):
+    source = '\n'.join(lines) + '\n'
+    code = compile(source, '<jsonmodels: {}>'.format(name), 'exec')
+    exec(code, namespace)
+    function = namespace[name]
+    function.source = source
+    return function
+
+
+def _marking_of_changes(cls):
+    """Get lines marking fields populated without validation as changed."""
+    record = "getattr(self, '_validation_record', None)"
+    if not cls._deferred_validation:
+        record = 'deferred and ' + record
+    return [
+        '    record = {}'.format(record),
+        '    if record:',
+        '        record.changed.update(kw)',
+    ]
+
+
+def compile_populate(cls):
+    """Compile `populate` function for given model class.
+
+    Generated function takes model instance and dictionary with values and
+    it is unrolled for all fields of model, so for each field it calls
+    directly its `parse_value` (unless it is not overridden) and `validate`
+    methods (unless validation is deferred - then it marks fields as not
+    validated, for next validation of model). Fields that override `__set__`
+    or `__get__` are set through their descriptor as usual.
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    fields = tuple(cls.iterate_over_fields())
+    namespace = {'is_deferred_validation': is_deferred_validation}
+    lines = ['def populate(self, kw):']
+    if not cls._deferred_validation:
+        lines.append('    deferred = is_deferred_validation()')
+    if _uses_dict(fields):
+        lines.append('    values = self.__dict__')
+    lines.extend(_marking_of_changes(cls))
+
+    for index, (name, field) in enumerate(fields):
+        field_ref = 'field_{}'.format(index)
+        namespace[field_ref] = field
+        lines.append('    if {!r} in kw:'.format(name))
+
+        if _overrides(field, '__set__') or _overrides(field, '__get__'):
+            lines.append('        {}.__set__(self, kw[{!r}])'.format(
+                field_ref, name))
+            continue
+
+        if _overrides(field, 'parse_value'):
+            namespace['parse_{}'.format(index)] = field.parse_value
+            lines.append('        value = parse_{}(kw[{!r}])'.format(
+                index, name))
+        else:
+            lines.append('        value = kw[{!r}]'.format(name))
+
+        if not cls._deferred_validation:
+            namespace['validate_{}'.format(index)] = field.validate
+            lines.append('        if not deferred:')
+            lines.append('            validate_{}(value)'.format(index))
+        if field.slot is None:
+            lines.append('        values[{!r}] = value'.format(name))
+        else:
+            namespace['store_{}'.format(index)] = field.slot.__set__
+            lines.append('        store_{}(self, value)'.format(index))
+
+    return _build('populate', lines, namespace)
+
+
+def get_serializer(cls):
+    """Get compiled serializer of given model class.
+
+    Serializer is compiled at first use and then cached on model class
+    (until its fields change).
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    return _get_compiled(cls, '_compiled_to_struct', compile_to_struct)
+
+
+def get_loader(cls):
+    """Get compiled loader of given model class.
+
+    Loader is compiled at first use and then cached on model class (until
+    its fields change).
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    return _get_compiled(cls, '_compiled_from_struct', compile_from_struct)
+
+
+def get_trusted_loader(cls):
+    """Get compiled loader of given model class, that skips validation.
+
+    Loader is compiled at first use and then cached on model class (until
+    its fields change).
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    return _get_compiled(cls, '_compiled_construct', compile_construct)
+
+
+def _get_compiled(cls, attribute, compile_function):
+    function = cls.__dict__.get(attribute)
+    if function is None:
+        function = compile_function(cls)
+        type.__setattr__(cls, attribute, function)
+    return function
+
+
+def to_struct(value):
+    """Cast value to Python structure with use of compiled serializers."""
+    from .models import Base
+
+    if isinstance(value, Base):
+        return get_serializer(type(value))(value)
+    return value
+
+
+def _any_to_struct(value):
+    if isinstance(value, list):
+        return [to_struct(item) for item in value]
+    return to_struct(value)
+
+
+def _may_contain(types, type_):
+    """Check if value of one of given types may be instance of `type_`."""
+    return any(
+        issubclass(t, type_) or issubclass(type_, t) for t in types)
+
+
+def _conversion_for(field, base):
+    """Get expression casting `value` of field to Python structure."""
+    if isinstance(field, ListField):
+        items_types = field.items_types
+        if items_types and all(issubclass(t, base) for t in items_types):
+            return '[get_serializer(type(item))(item) for item in value]'
+        if items_types and not _may_contain(items_types, base):
+            return 'list(value)'
+        return '[value_to_struct(item) for item in value]'
+
+    types = field.types
+    if types is None or _may_contain(types, list):
+        return 'any_to_struct(value)'
+    if (isinstance(field, EmbeddedField) and
+            all(issubclass(t, base) for t in types)):
+        return 'get_serializer(type(value))(value)'
+    if not _may_contain(types, base):
+        return 'value'
+    return 'value_to_struct(value)'
+
+
+def compile_to_struct(cls):
+    """Compile function casting instances of given model class to dict.
+
+    Generated function does the same as :func:`jsonmodels.parsers.to_struct`,
+    but reads values directly from instance and casts each value with
+    conversion specialized for type of its field.
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    from .models import Base
+
+    namespace = {
+        'get_serializer': get_serializer,
+        'value_to_struct': to_struct,
+        'any_to_struct': _any_to_struct,
+    }
+    fields = tuple(cls.iterate_over_fields())
+    lines = ['def to_struct(model):', '    model.validate()']
+    if _uses_dict(fields):
+        lines.append('    values = model.__dict__')
+    lines.append('    resp = {}')
+
+    for index, (name, field) in enumerate(fields):
+        field_ref = 'field_{}'.format(index)
+        namespace[field_ref] = field
+
+        if _overrides(field, '__get__'):
+            lines.append('    value = {}.__get__(model)'.format(field_ref))
+        elif field.slot is None:
+            lines.extend([
+                '    try:',
+                '        value = values[{!r}]'.format(name),
+                '    except KeyError:',
+                '        value = {}.__get__(model)'.format(field_ref),
+            ])
+        else:
+            namespace['load_{}'.format(index)] = field.slot.__get__
+            lines.extend([
+                '    try:',
+                '        value = load_{}(model)'.format(index),
+                '    except AttributeError:',
+                '        value = {}.__get__(model)'.format(field_ref),
+            ])
+
+        conversion = _conversion_for(field, Base)
+        if (isinstance(field, EmbeddedField) and
+                field.types_by_discriminator is not None):
+            conversion = '{}.add_discriminator({}, value)'.format(
+                field_ref, conversion)
+        lines.extend([
+            '    if value is not None:',
+            '        resp[{!r}] = {}'.format(name, conversion),
+        ])
+
+    lines.append('    return resp')
+    return _build('to_struct', lines, namespace)
+
+
+def _single_model_type(types, base):
+    if types is not None and len(types) == 1 and issubclass(types[0], base):
+        return types[0]
+    return None
+
+
+def _embedded_type_for(field, index, namespace, base):
+    """Get expression of type of embedded model, which can be created from
+    `value` (dict) with compiled loader, if field embeds such models."""
+    if type(field).parse_value != EmbeddedField.parse_value:
+        return None
+
+    if _single_model_type(field.types, base):
+        type_ref = 'type_{}'.format(index)
+        namespace[type_ref] = field.types[0]
+        return type_ref
+    if (field.types_by_discriminator is not None and
+            all(issubclass(t, base) for t in field.types)):
+        resolve_ref = 'resolve_{}'.format(index)
+        namespace[resolve_ref] = field.resolve_type
+        return '{}(value)'.format(resolve_ref)
+    return None
+
+
+def _load_models(field, model_type, values):
+    """Load list of models of single type, as `ListField.parse_value` does."""
+    load = get_loader(model_type)
+    result = field.get_default_value()
+    for value in values:
+        if isinstance(value, field.items_types):
+            list.append(result, value)
+        elif isinstance(value, dict):
+            list.append(result, load(value))
+        else:
+            # Let reference implementation raise proper error.
+            return field.parse_value(values)
+    return result
+
+
+def _construct_models(field, model_type, values):
+    """Create list of models of single type, without validation."""
+    construct = get_trusted_loader(model_type)
+    result = field.get_default_value()
+    for value in values:
+        if isinstance(value, dict):
+            value = construct(value)
+        list.append(result, value)
+    return result
+
+
+def _trusted_loading_for(field, index, namespace, base):
+    """Get lines casting `value` of field from Python structure (without
+    validating it)."""
+    type_ref = 'type_{}'.format(index)
+    parse_ref = 'parse_{}'.format(index)
+    namespace[parse_ref] = field.parse_value
+
+    embedded_type = _embedded_type_for(field, index, namespace, base)
+    if embedded_type is not None:
+        return [
+            '        if isinstance(value, dict):',
+            '            value = get_trusted_loader({})(value)'.format(
+                embedded_type),
+        ]
+
+    if (type(field).parse_value == ListField.parse_value and
+            _single_model_type(field.items_types, base)):
+        namespace[type_ref] = field.items_types[0]
+        return [
+            '        if value and isinstance(value, list):',
+            '            value = construct_models(field_{}, {}, value)'.format(
+                index, type_ref),
+            '        else:',
+            '            value = {}(value)'.format(parse_ref),
+        ]
+
+    if _overrides(field, 'parse_value'):
+        return ['        value = {}(value)'.format(parse_ref)]
+    return []
+
+
+def _loading_for(field, index, namespace, base):
+    """Get lines casting `value` of field from Python structure and
+    validating it.
+
+    Embedded model created by loader has all its embedded models validated
+    already, so it is validated only shallowly.
+
+    """
+    type_ref = 'type_{}'.format(index)
+    parse_ref = 'parse_{}'.format(index)
+    validate_ref = 'validate_{}'.format(index)
+    namespace[parse_ref] = field.parse_value
+    namespace[validate_ref] = field.validate
+
+    embedded_type = _embedded_type_for(field, index, namespace, base)
+    if embedded_type is not None:
+        return [
+            '        if isinstance(value, dict):',
+            '            value = get_loader({})(value)'.format(embedded_type),
+            '            with shallow_validation():',
+            '                value.validate()',
+            '                {}(value)'.format(validate_ref),
+            '        else:',
+            '            {}(value)'.format(validate_ref),
+        ]
+
+    lines = []
+    if (type(field).parse_value == ListField.parse_value and
+            _single_model_type(field.items_types, base)):
+        namespace[type_ref] = field.items_types[0]
+        lines = [
+            '        if value and isinstance(value, list):',
+            '            value = load_models(field_{}, {}, value)'.format(
+                index, type_ref),
+            '        else:',
+            '            value = {}(value)'.format(parse_ref),
+        ]
+    elif _overrides(field, 'parse_value'):
+        lines = ['        value = {}(value)'.format(parse_ref)]
+
+    lines.append('        {}(value)'.format(validate_ref))
+    return lines
+
+
+def compile_from_struct(cls):
+    """Compile function creating instance of given model class from dict.
+
+    Generated function does the same as `cls(**data)`, but sets each field
+    directly (as function compiled by :func:`compile_populate` does) and
+    creates embedded models with loaders compiled for their classes, instead
+    of passing values through keyword arguments. Model class that overrides
+    `__init__` or `populate` is just called. For model class that defers
+    validation, it is the same as function compiled by
+    :func:`compile_construct`.
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    if cls._deferred_validation:
+        return _compile_loader(cls, 'from_struct', _trusted_loading_for)
+    return _compile_loader(cls, 'from_struct', _loading_for)
+
+
+def compile_construct(cls):
+    """Compile function creating instance of given model class from trusted
+    dict.
+
+    Generated function works as one compiled by :func:`compile_from_struct`,
+    but values (and embedded models) are only parsed - neither types nor
+    validators are checked. Fields that override `__set__` or `__get__` and
+    model classes that override `__init__` or `populate` are validated
+    anyway.
+
+    :param cls: Model class.
+    :rtype: function
+
+    """
+    return _compile_loader(cls, 'construct', _trusted_loading_for)
+
+
+def _compile_loader(cls, name, loading_for):
+    from .models import Base
+
+    if _overrides_any(cls, Base, ('__init__', 'populate')):
+        return lambda data: cls(**data)
+
+    namespace = {
+        'cls': cls,
+        'get_loader': get_loader,
+        'get_trusted_loader': get_trusted_loader,
+        'load_models': _load_models,
+        'construct_models': _construct_models,
+        'shallow_validation': shallow_validation,
+    }
+    fields = tuple(cls.iterate_over_fields())
+    lines = ['def {}(data):'.format(name), '    model = cls.__new__(cls)']
+    if _uses_dict(fields):
+        lines.append('    values = model.__dict__')
+
+    for index, (field_name, field) in enumerate(fields):
+        field_ref = 'field_{}'.format(index)
+        namespace[field_ref] = field
+        lines.append('    if {!r} in data:'.format(field_name))
+
+        if _overrides(field, '__set__') or _overrides(field, '__get__'):
+            lines.append('        {}.__set__(model, data[{!r}])'.format(
+                field_ref, field_name))
+            continue
+
+        lines.append('        value = data[{!r}]'.format(field_name))
+        lines.extend(loading_for(field, index, namespace, Base))
+        if field.slot is None:
+            lines.append('        values[{!r}] = value'.format(field_name))
+        else:
+            namespace['store_{}'.format(index)] = field.slot.__set__
+            lines.append('        store_{}(model, value)'.format(index))
+
+    lines.append('    return model')
+    return _build(name, lines, namespace)
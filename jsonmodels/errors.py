@@ -1,10 +1,275 @@
+import string
+
+
+class _MessageFormatter(string.Formatter):
+
+    """Formatter of templates of messages.
+
+    Besides standard conversions, it knows conversion `n` (rendering
+    sequence of types as their names joined with commas), conversion `j`
+    (joining items with semicolons) and conversion `c` (calling value, which
+    renders it).
+
+    """
+
+    def convert_field(self, value, conversion):
+        if conversion == 'n':
+            return ', '.join([t.__name__ for t in value])
+        if conversion == 'j':
+            return '; '.join([str(item) for item in value])
+        if conversion == 'c':
+            return value()
+        return super(_MessageFormatter, self).convert_field(
+            value, conversion)
+
+
+_formatter = _MessageFormatter()
+
+_codes = {}
+
+
+def _get_code(name):
+    return _codes[name]
+
+
+class ErrorCode(object):
+
+    """Code of validation error.
+
+    Code is passed to :class:`ValidationError` as first argument, followed
+    by values of its `params` (in the same order). Message of error is
+    rendered from template for `name` of code (see
+    `ValidationError.MESSAGES`) formatted with these params. Params listed
+    in `args` are also added to `args` of error after message.
+
+    """
+
+    def __init__(self, name, params=(), args=()):
+        self.name = name
+        self.params = params
+        self.args = args
+        _codes[name] = self
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.name)
+
+    def __reduce__(self):
+        return _get_code, (self.name,)
+
+
+REQUIRED = ErrorCode('required', ('field',))
+NOT_USABLE = ErrorCode('not_usable', ('field', 'value', 'field_type'))
+WRONG_TYPE = ErrorCode('wrong_type', ('field', 'value', 'types'), ('value',))
+WRONG_ITEM_TYPE = ErrorCode('wrong_item_type', ('field', 'value', 'types'))
+AMBIGUOUS_TYPE = ErrorCode('ambiguous_type', ('field', 'types'))
+UNKNOWN_DISCRIMINATOR = ErrorCode(
+    'unknown_discriminator', ('field', 'value', 'discriminator'))
+NOT_ITERABLE = ErrorCode('not_iterable', ('field', 'value'))
+NOT_ISO8601 = ErrorCode('not_iso8601', ('value',), ('value',))
+NOT_DICT = ErrorCode('not_dict', ('value',))
+MIN = ErrorCode('min', ('value', 'minimum'))
+MIN_EXCLUSIVE = ErrorCode('min_exclusive', ('value', 'minimum'))
+MAX = ErrorCode('max', ('value', 'maximum'))
+MAX_EXCLUSIVE = ErrorCode('max_exclusive', ('value', 'maximum'))
+NO_MATCH = ErrorCode('no_match', ('value', 'pattern'))
+TOO_SHORT = ErrorCode('too_short', ('value', 'minimum'))
+TOO_LONG = ErrorCode('too_long', ('value', 'maximum'))
+NOT_ALLOWED = ErrorCode('not_allowed', ('value', 'allowed_values'))
+FIELD = ErrorCode('field', ('field_name', 'error'))
+AGGREGATED = ErrorCode('aggregated', ('count', 'errors'))
+ITEM = ErrorCode('item', ('offset', 'error'), ('offset',))
 
 
 class ValidationError(RuntimeError):
 
-    pass
+    """Error of validation.
+
+    Error can be created as any exception (with message), or with
+    :class:`ErrorCode` as first argument, followed by values of params of
+    code. Message is then rendered from template for code (see `MESSAGES`)
+    only when it is needed (when error is casted to string, or its `args`
+    are read), so errors that are just caught are cheap.
+
+    """
+
+    #: Templates of messages, by names of codes of errors. They are formatted
+    #: with params of error.
+    MESSAGES = {
+        'required': 'Field is required!',
+        'not_usable': (
+            'Field "{field_type}" is not usable, try different field type.'),
+        'wrong_type': 'Value is wrong, expected type "{types!n}"',
+        'wrong_item_type': (
+            'All items must be instances of "{types!n}", and not '
+            '"{value.__class__.__name__}".'),
+        'ambiguous_type': (
+            'Cannot decide which type to choose from "{types!n}".'),
+        'unknown_discriminator': (
+            'Cannot decide which type to choose for "{discriminator}" '
+            'equal to "{value}".'),
+        'not_iterable': 'Given value for field is not iterable.',
+        'not_iso8601': 'Value is not valid ISO 8601 string.',
+        'not_dict': 'Expected dict, got "{value.__class__.__name__}".',
+        'min': "'{value}' is lower than minimum ('{minimum}').",
+        'min_exclusive': (
+            "'{value}' is lower or equal than minimum ('{minimum}')."),
+        'max': "'{value}' is bigger than maximum ('{maximum}').",
+        'max_exclusive': (
+            "'{value}' is bigger or equal than maximum ('{maximum}')."),
+        'no_match': 'Value "{value}" did not match pattern "{pattern}".',
+        'too_short': (
+            "Value '{value}' length is lower than allowed minimum "
+            "'{minimum}'."),
+        'too_long': (
+            "Value '{value}' length is bigger than allowed maximum "
+            "'{maximum}'."),
+        'not_allowed': (
+            "Value '{value}' is not an allowed value. It should be equal "
+            "to one of the following values: '{allowed_values!c}'."),
+        'field': 'Error for field "{field_name}": {error}',
+        'aggregated': 'Found {count} validation errors: {errors!j}',
+        'item': 'Item at offset {offset} is invalid: {error}',
+    }
+
+    @property
+    def _coded_args(self):
+        args = RuntimeError.args.__get__(self)
+        if args and type(args[0]) is ErrorCode:
+            return args
+        return None
+
+    @property
+    def code(self):
+        """Name of code of error (or `None` for plain errors)."""
+        args = self._coded_args
+        return args[0].name if args else None
+
+    @property
+    def params(self):
+        """Params of error (without `field` and `value`), by names."""
+        args = self._coded_args
+        if not args:
+            return None
+        params = dict(zip(args[0].params, args[1:]))
+        params.pop('field', None)
+        params.pop('value', None)
+        return params
+
+    @property
+    def field(self):
+        """Field, which value is invalid."""
+        return self._get_param('field')
+
+    @property
+    def value(self):
+        """Invalid value."""
+        return self._get_param('value')
+
+    def _get_param(self, name):
+        args = self._coded_args
+        if args and name in args[0].params:
+            return args[args[0].params.index(name) + 1]
+        return None
+
+    @property
+    def message(self):
+        """Message of error, rendered from template for its code."""
+        args = self._coded_args
+        if not args:
+            return None
+        params = dict(zip(args[0].params, args[1:]))
+        return _formatter.vformat(self.MESSAGES[args[0].name], (), params)
+
+    @property
+    def args(self):
+        args = self._coded_args
+        if not args:
+            return RuntimeError.args.__get__(self)
+        return (self.message,) + tuple(
+            self._get_param(name) for name in args[0].args)
+
+    @args.setter
+    def args(self, args):
+        # Assigned args replace code, so message is not rendered anymore.
+        RuntimeError.args.__set__(self, args)
+
+    def __str__(self):
+        args = self.args
+        if not args:
+            return ''
+        if len(args) == 1:
+            return str(args[0])
+        return str(args)
+
+    def __repr__(self):
+        args = self.args
+        if len(args) == 1:
+            return '{}({!r})'.format(type(self).__name__, args[0])
+        return '{}{!r}'.format(type(self).__name__, args)
+
+    def __reduce__(self):
+        # Field is not pickled (it doesn't have to be picklable).
+        args = RuntimeError.args.__get__(self)
+        if args and type(args[0]) is ErrorCode and 'field' in args[0].params:
+            offset = args[0].params.index('field') + 1
+            args = args[:offset] + (None,) + args[offset + 1:]
+        return type(self), args, self.__dict__ or None
 
 
 class FieldNotFound(RuntimeError):
 
     pass
+
+
+class FieldValidationError(ValidationError):
+
+    """Validation error of field of model.
+
+    Original error is kept in `error` attribute and name of field in
+    `field_name` attribute.
+
+    """
+
+    def __init__(self, field_name, error):
+        super(FieldValidationError, self).__init__(FIELD, field_name, error)
+        self.field_name = field_name
+        self.error = error
+
+    def __reduce__(self):
+        return type(self), (self.field_name, self.error)
+
+
+class AggregatedValidationError(ValidationError):
+
+    """Validation errors of tree of models, collected at once.
+
+    Collected errors (instances of :class:`FieldValidationError`, with paths
+    of invalid values) are kept in `errors` attribute.
+
+    """
+
+    def __init__(self, errors):
+        super(AggregatedValidationError, self).__init__(
+            AGGREGATED, len(errors), errors)
+        self.errors = errors
+
+    def __reduce__(self):
+        return type(self), (self.errors,)
+
+
+class ItemValidationError(ValidationError):
+
+    """Validation error of item read from stream.
+
+    Original error is kept in `error` attribute and offset of item in stream
+    in `offset` attribute.
+
+    """
+
+    def __init__(self, offset, error):
+        super(ItemValidationError, self).__init__(ITEM, offset, error)
+        self.offset = offset
+        self.error = error
+
+    def __reduce__(self):
+        return type(self), (self.offset, self.error)
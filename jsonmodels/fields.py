@@ -1,10 +1,114 @@
 import datetime
+import itertools
+import threading
 
 import six
 from dateutil.parser import parse
 
+from . import errors
 from .errors import ValidationError
-from .collections import ModelCollection
+from .collections import ModelCollection, ValidatorCollection
+from .utilities import LRUCache, parse_iso8601_datetime, parse_iso8601_time
+
+_creation_counter = itertools.count()
+
+
+class _ValidationState(threading.local):
+
+    shallow_depth = 0
+    deferred_depth = 0
+
+
+class _ValidationMode(object):
+
+    """Context manager turning on validation mode, kept in `attribute` of
+    validation state (as depth, so it can be nested)."""
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+
+    def __enter__(self):
+        depth = getattr(_validation_state, self.attribute)
+        setattr(_validation_state, self.attribute, depth + 1)
+
+    def __exit__(self, *exc_info):
+        depth = getattr(_validation_state, self.attribute)
+        setattr(_validation_state, self.attribute, depth - 1)
+
+
+_validation_state = _ValidationState()
+_shallow_validation = _ValidationMode('shallow_depth')
+_deferred_validation = _ValidationMode('deferred_depth')
+
+
+def is_shallow_validation():
+    """Check if embedded models are skipped during validation."""
+    return _validation_state.shallow_depth > 0
+
+
+def shallow_validation():
+    """Skip validation of embedded models, when their parents are validated.
+
+    Useful when walking through tree of models, where each model is
+    validated on its own anyway. Returns context manager.
+
+    """
+    return _shallow_validation
+
+
+def is_deferred_validation():
+    """Check if values assigned to fields are not validated."""
+    return _validation_state.deferred_depth > 0
+
+
+def deferred_validation():
+    """Defer validation of values assigned to fields of models.
+
+    Values are only parsed when they are assigned (also when models are
+    created), and models are validated once, when they are validated
+    explicitly or casted. Returns context manager.
+
+    """
+    return _deferred_validation
+
+
+_rules_version = 0
+
+
+def forget_validations():
+    """Forget that any model was validated.
+
+    Called when rules of validation change (like when fields of model or
+    their `required` or `validators` attributes are assigned), so models
+    validated before are fully validated next time.
+
+    """
+    global _rules_version
+    _rules_version += 1
+
+
+class ValidationRecord(object):
+
+    """Record of successful validation of model.
+
+    Keeps names of fields of model assigned since it was validated (in
+    `changed` attribute), so only those can be validated next time. Record
+    is valid only until rules of validation change, and it is not carried
+    over when model is pickled.
+
+    """
+
+    __slots__ = ('version', 'changed')
+
+    def __init__(self, version=None):
+        self.version = _rules_version if version is None else version
+        self.changed = set()
+
+    def is_current(self):
+        return self.version == _rules_version
+
+    def __reduce__(self):
+        return type(self), (-1,)
 
 
 class BaseField(object):
@@ -18,7 +122,11 @@ class BaseField(object):
             required=False,
             help_text=None,
             validators=None):
-        self._memory = {}
+        self._validation = None
+        self.owner = None
+        self.name = None
+        self.slot = None
+        self.creation_order = next(_creation_counter)
         self.required = required
         self.help_text = help_text
         self._assign_validators(validators)
@@ -26,52 +134,131 @@ class BaseField(object):
     def _assign_validators(self, validators):
         if validators and not isinstance(validators, list):
             validators = [validators]
-        self.validators = validators or []
+        self.validators = validators or ()
 
     def __set__(self, obj, value):
         value = self.parse_value(value)
-        self.validate(value)
-        self._memory[obj] = value
+        deferred = (
+            _validation_state.deferred_depth or obj._deferred_validation)
+        if not deferred:
+            self.validate(value)
+        if self.slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            self.slot.__set__(obj, value)
+
+        if deferred:
+            record = getattr(obj, '_validation_record', None)
+            if record is not None:
+                record.changed.add(self.name)
 
     def __get__(self, obj, owner=None):
         if obj is None:
             return self
 
-        self._check_value(obj)
-        return self._memory[obj]
-
-    def _check_value(self, obj):
-        if obj not in self._memory:
+        try:
+            if self.slot is None:
+                return obj.__dict__[self.name]
+            return self.slot.__get__(obj)
+        except (KeyError, AttributeError):
             self.__set__(obj, self.get_default_value())
+            return self.__get__(obj)
 
     def validate_for_object(self, obj):
         value = self.__get__(obj)
         self.validate(value)
 
-    def validate(self, value):
-        self._check_types()
-        self._validate_against_types(value)
-        self._check_against_required(value)
-        self._validate_with_custom_validators(value)
+    def validate_changes_for_object(self, obj):
+        """Validate value of field, that was not assigned since object was
+        validated last time.
 
-    def _check_against_required(self, value):
-        if value is None and self.required:
-            raise ValidationError('Field is required!')
+        Only fields with values that can change in place (like lists or
+        embedded models) have anything to validate.
 
-    def _validate_against_types(self, value):
-        if value is not None and not isinstance(value, self.types):
-            raise ValidationError(
-                'Value is wrong, expected type "{}"'.format(
-                    ', '.join([t.__name__ for t in self.types])
-                ),
-                value
-            )
+        """
+
+    def collect_errors(self, value, path, collector):
+        """Validate value, passing errors to collector (with path of value)
+        instead of raising them."""
+        try:
+            self.validate(value)
+        except ValidationError as error:
+            collector.add(path, error)
 
-    def _check_types(self):
+    def validate(self, value):
+        """Validate value.
+
+        Validation (checks of type, requirement and custom validators) is
+        compiled into single function at first use, and compiled again only
+        when `types`, `required` or `validators` attribute is assigned (or
+        list of validators is changed).
+
+        """
+        validation = self._validation
+        if validation is None:
+            validation = self._validation = self._compile_validation()
+        validation(value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_validation'] = None
+        return state
+
+    def __copy__(self):
+        copied = type(self).__new__(type(self))
+        copied.__dict__.update(self.__getstate__())
+        copied.__dict__['validators'] = ValidatorCollection(
+            copied, self.validators)
+        return copied
+
+    def __reduce_ex__(self, protocol):
+        # Field of model is pickled as reference to it, so values that refer
+        # to their field (like collections) are pickled cheaply.
+        if self.owner is not None and vars(self.owner).get(self.name) is self:
+            return getattr, (self.owner, self.name)
+        return super(BaseField, self).__reduce_ex__(protocol)
+
+    def __setattr__(self, name, value):
+        if name == 'validators' and not (
+                isinstance(value, ValidatorCollection) and
+                value.field is self):
+            value = ValidatorCollection(self, value)
+        super(BaseField, self).__setattr__(name, value)
+        if name in ('types', 'required', 'validators'):
+            super(BaseField, self).__setattr__('_validation', None)
+        # Only fields of models are used to validate them.
+        if name in ('types', 'required', 'validators', 'items_types') and (
+                getattr(self, 'owner', None) is not None):
+            forget_validations()
+
+    def _compile_validation(self):
         if self.types is None:
-            raise ValidationError(
-                'Field "{}" is not usable, try '
-                'different field type.'.format(type(self).__name__))
+            return self._raise_not_usable
+
+        types = self.types
+        required = self.required
+        validators = tuple(
+            getattr(validator, 'validate', validator)
+            for validator in self.validators)
+
+        def validation(value):
+            if value is None:
+                if required:
+                    raise ValidationError(errors.REQUIRED, self)
+            elif not isinstance(value, types):
+                self._raise_wrong_type(value)
+
+            for validator in validators:
+                validator(value)
+
+        return validation
+
+    def _raise_not_usable(self, value):
+        raise ValidationError(
+            errors.NOT_USABLE, self, value, type(self).__name__)
+
+    def _raise_wrong_type(self, value):
+        raise ValidationError(errors.WRONG_TYPE, self, value, self.types)
 
     def to_struct(self, value):
         """Cast value to Python structure."""
@@ -86,13 +273,6 @@ class BaseField(object):
         """
         return value
 
-    def _validate_with_custom_validators(self, value):
-        for validator in self.validators:
-            try:
-                validator.validate(value)
-            except AttributeError:
-                validator(value)
-
     @staticmethod
     def get_default_value():
         """Get default value for field.
@@ -165,14 +345,43 @@ class ListField(BaseField):
     def validate(self, value):
         super(ListField, self).validate(value)
 
-        if len(self.items_types) == 0:
-            return
+        if len(self.items_types) != 0:
+            try:
+                for item in value:
+                    self.validate_single_value(item)
+            except TypeError:
+                pass
 
+        if isinstance(value, ModelCollection):
+            value.changed = False
+
+    def collect_errors(self, value, path, collector):
+        """Validate list and each of its items (with their indexes in path),
+        passing errors to collector."""
         try:
-            for item in value:
+            super(ListField, self).validate(value)
+        except ValidationError as error:
+            collector.add(path, error)
+        if not isinstance(value, list):
+            return
+
+        for index, item in enumerate(value):
+            item_path = '{}[{}]'.format(path, index)
+            try:
                 self.validate_single_value(item)
-        except TypeError:
-            pass
+            except ValidationError as error:
+                collector.add(item_path, error)
+            else:
+                collector.collect(item, item_path)
+
+    def validate_changes_for_object(self, obj):
+        """Validate list again, if it was changed (or if it is plain list, so
+        its changes are not tracked, or if field has validators, which can
+        check items changed in place)."""
+        value = self.__get__(obj)
+        if (self.validators or not isinstance(value, ModelCollection) or
+                value.changed):
+            self.validate(value)
 
     def validate_single_value(self, item):
         if len(self.items_types) == 0:
@@ -180,11 +389,7 @@ class ListField(BaseField):
 
         if not isinstance(item, self.items_types):
             raise ValidationError(
-                'All items must be instances '
-                'of "{}", and not "{}".'.format(
-                    ', '.join([t.__name__ for t in self.items_types]),
-                    type(item).__name__
-                ))
+                errors.WRONG_ITEM_TYPE, self, item, self.items_types)
 
     def to_struct(self, value):
         """Cast value to list."""
@@ -216,17 +421,14 @@ class ListField(BaseField):
     def _check_items_types_count(self):
         if len(self.items_types) != 1:
             raise ValidationError(
-                'Cannot decide which type to choose from "{}".'.format(
-                    ', '.join([t.__name__ for t in self.items_types])
-                )
-            )
+                errors.AMBIGUOUS_TYPE, self, self.items_types)
 
     def _parse_values_to_result(self, values, embed_type, result):
         try:
             for value in values:
                 self._append_value_to_result(value, result, embed_type)
         except TypeError:
-            raise ValidationError('Given value for field is not iterable.')
+            raise ValidationError(errors.NOT_ITERABLE, self, values)
 
     def _append_value_to_result(self, value, result, embed_type):
         if isinstance(value, self.items_types):
@@ -240,41 +442,191 @@ class EmbeddedField(BaseField):
     """Field for embedded models."""
 
     def __init__(self, model_types, *args, **kwargs):
+        """Init.
+
+        :param model_types: Type of embedded model, list of types, or dict
+            mapping values of discriminator to types.
+        :param str discriminator: Name of key of dict, which value decides
+            which type of model is created from dict (required if types are
+            mapped). Key is added to structures of embedded models (unless
+            models have field with such name).
+
+        """
+        self.discriminator = kwargs.pop('discriminator', None)
         self._assign_model_types(model_types)
         super(EmbeddedField, self).__init__(*args, **kwargs)
 
     def _assign_model_types(self, model_types):
+        self.types_by_discriminator = None
+        self._discriminators_by_type = {}
+        if isinstance(model_types, dict):
+            self._assign_mapped_types(model_types)
+            return
+        if self.discriminator is not None:
+            raise ValueError(
+                'Types must be mapped by values of discriminator.')
+
         try:
             iter(model_types)
             self.types = tuple(model_types)
         except TypeError:
             self.types = (model_types,)
 
+    def _assign_mapped_types(self, types_by_discriminator):
+        if self.discriminator is None:
+            raise ValueError(
+                "'discriminator' must be specified for mapped types.")
+
+        types = []
+        for value, type_ in types_by_discriminator.items():
+            if type_ not in types:
+                types.append(type_)
+                self._discriminators_by_type[type_] = value
+        self.types_by_discriminator = dict(types_by_discriminator)
+        self.types = tuple(types)
+
     def validate(self, value):
         super(EmbeddedField, self).validate(value)
+        if is_shallow_validation():
+            return
+
+        validate = getattr(value, 'validate', None)
+        if validate is not None:
+            validate()
+
+    def collect_errors(self, value, path, collector):
+        """Validate value and embedded model (with path of its fields),
+        passing errors to collector."""
         try:
-            value.validate()
-        except AttributeError:
-            pass
+            with shallow_validation():
+                self.validate(value)
+        except ValidationError as error:
+            collector.add(path, error)
+        else:
+            collector.collect(value, path)
+
+    def validate_changes_for_object(self, obj):
+        """Validate embedded model (only its fields that changed).
+
+        If field has validators, they are run again too, as they can check
+        fields of embedded model.
+
+        """
+        if self.validators:
+            self.validate(self.__get__(obj))
+            return
+        if is_shallow_validation():
+            return
+
+        validate = getattr(self.__get__(obj), 'validate', None)
+        if validate is not None:
+            validate()
 
     def parse_value(self, value):
         """Parse value to proper model type."""
         if not isinstance(value, dict):
             return value
 
-        embed_type = self._get_embed_type()
+        embed_type = self.resolve_type(value)
         return embed_type(**value)
 
+    def resolve_type(self, data):
+        """Get type of model to create from dict (chosen by value of
+        discriminator, if types are mapped)."""
+        if self.types_by_discriminator is None:
+            return self._get_embed_type()
+
+        value = data.get(self.discriminator)
+        try:
+            return self.types_by_discriminator[value]
+        except (KeyError, TypeError):
+            raise ValidationError(
+                errors.UNKNOWN_DISCRIMINATOR, self, value, self.discriminator)
+
+    def get_discriminator(self, model):
+        """Get value of discriminator for type of given model, to add to its
+        structure (`None` if types are not mapped, or if model has field with
+        name of discriminator). Subclasses of mapped types get value of
+        their closest mapped base."""
+        model_type = type(model)
+        if not self._discriminators_by_type or isinstance(
+                getattr(model_type, self.discriminator, None), BaseField):
+            return None
+        for type_ in model_type.__mro__:
+            value = self._discriminators_by_type.get(type_)
+            if value is not None:
+                return value
+        return None
+
+    def add_discriminator(self, struct, model):
+        """Add discriminator to structure of given model (if needed)."""
+        value = self.get_discriminator(model)
+        if value is not None:
+            struct[self.discriminator] = value
+        return struct
+
     def _get_embed_type(self):
         if len(self.types) != 1:
-            raise ValidationError(
-                'Cannot decide which type to choose from "{}".'.format(
-                    ', '.join([t.__name__ for t in self.types])
-                )
-            )
+            raise ValidationError(errors.AMBIGUOUS_TYPE, self, self.types)
         return self.types[0]
 
 
+def _parse_date_string(value, iso_parser, strict, cast):
+    """Parse value with fast ISO 8601 parser, fall back to `dateutil`."""
+    try:
+        parsed = iso_parser(value)
+    except ValueError:
+        parsed = None
+
+    if parsed is not None:
+        return parsed
+    if strict:
+        raise ValidationError(errors.NOT_ISO8601, value)
+
+    parsed = parse(value)
+    return cast(parsed) if cast is not None else parsed
+
+
+def _parse_date_value(field, value, iso_parser, cast=None):
+    """Parse value for date or time field (looking it up in its cache first).
+
+    Optional `cast` is applied to `datetime` returned by `dateutil`.
+
+    """
+    cache = field.cache
+    if cache is None or not isinstance(value, six.string_types):
+        return _parse_date_string(value, iso_parser, field.strict, cast)
+
+    key = (type(field), field.strict, value)
+    parsed = cache.get(key)
+    if parsed is None:
+        parsed = cache[key] = _parse_date_string(
+            value, iso_parser, field.strict, cast)
+    return parsed
+
+
+def _get_cache(cache):
+    if cache is None or isinstance(cache, LRUCache):
+        return cache
+    return LRUCache(cache)
+
+
+def _parse_iso8601_time(value):
+    parsed = parse_iso8601_time(value)
+    if parsed is None:
+        parsed = parse_iso8601_datetime(value)
+        if parsed is not None:
+            parsed = parsed.timetz()
+    return parsed
+
+
+def _parse_iso8601_date(value):
+    parsed = parse_iso8601_datetime(value)
+    if parsed is not None:
+        parsed = parsed.date()
+    return parsed
+
+
 class TimeField(StringField):
 
     """Time field."""
@@ -286,9 +638,16 @@ class TimeField(StringField):
 
         :param str str_format: Format to cast time to (if `None` - casting to
             ISO 8601 format).
+        :param bool strict: If `True`, only ISO 8601 strings are accepted
+            (otherwise strings in other formats are parsed with `dateutil`).
+        :param cache: Size of cache of parsed strings, or instance of
+            :class:`jsonmodels.utilities.LRUCache` (which can be shared by
+            many fields). By default nothing is cached.
 
         """
         self.str_format = str_format
+        self.strict = kwargs.pop('strict', False)
+        self.cache = _get_cache(kwargs.pop('cache', None))
         super(TimeField, self).__init__(*args, **kwargs)
 
     def to_struct(self, value):
@@ -299,9 +658,10 @@ class TimeField(StringField):
 
     def parse_value(self, value):
         """Parse string into instance of `time`."""
-        if isinstance(value, datetime.time):
+        if value is None or isinstance(value, datetime.time):
             return value
-        return parse(value).timetz()
+        return _parse_date_value(
+            self, value, _parse_iso8601_time, datetime.datetime.timetz)
 
 
 class DateField(StringField):
@@ -316,9 +676,16 @@ class DateField(StringField):
 
         :param str str_format: Format to cast date to (if `None` - casting to
             %Y-%m-%d format).
+        :param bool strict: If `True`, only ISO 8601 strings are accepted
+            (otherwise strings in other formats are parsed with `dateutil`).
+        :param cache: Size of cache of parsed strings, or instance of
+            :class:`jsonmodels.utilities.LRUCache` (which can be shared by
+            many fields). By default nothing is cached.
 
         """
         self.str_format = str_format
+        self.strict = kwargs.pop('strict', False)
+        self.cache = _get_cache(kwargs.pop('cache', None))
         super(DateField, self).__init__(*args, **kwargs)
 
     def to_struct(self, value):
@@ -329,9 +696,10 @@ class DateField(StringField):
 
     def parse_value(self, value):
         """Parse string into instance of `date`."""
-        if isinstance(value, datetime.date):
+        if value is None or isinstance(value, datetime.date):
             return value
-        return parse(value).date()
+        return _parse_date_value(
+            self, value, _parse_iso8601_date, datetime.datetime.date)
 
 
 class DateTimeField(StringField):
@@ -345,9 +713,16 @@ class DateTimeField(StringField):
 
         :param str str_format: Format to cast datetime to (if `None` - casting
             to ISO 8601 format).
+        :param bool strict: If `True`, only ISO 8601 strings are accepted
+            (otherwise strings in other formats are parsed with `dateutil`).
+        :param cache: Size of cache of parsed strings, or instance of
+            :class:`jsonmodels.utilities.LRUCache` (which can be shared by
+            many fields). By default nothing is cached.
 
         """
         self.str_format = str_format
+        self.strict = kwargs.pop('strict', False)
+        self.cache = _get_cache(kwargs.pop('cache', None))
         super(DateTimeField, self).__init__(*args, **kwargs)
 
     def to_struct(self, value):
@@ -358,6 +733,6 @@ class DateTimeField(StringField):
 
     def parse_value(self, value):
         """Parse string into instance of `datetime`."""
-        if isinstance(value, datetime.datetime):
+        if value is None or isinstance(value, datetime.datetime):
             return value
-        return parse(value)
+        return _parse_date_value(self, value, parse_iso8601_datetime)
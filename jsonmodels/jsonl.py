@@ -0,0 +1,213 @@
+"""Reading and writing models in JSON Lines format, in parallel."""
+
+import collections
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import timeit
+
+from . import errors
+from .errors import ItemValidationError, ValidationError
+
+#: Number of records sent to worker process at once.
+CHUNK_SIZE = 1000
+
+
+class WorkerStats(object):
+
+    """Number of records processed by worker and time it spent on them."""
+
+    def __init__(self):
+        self.records = 0
+        self.seconds = 0.0
+
+    @property
+    def throughput(self):
+        """Number of records processed per second."""
+        if not self.seconds:
+            return 0.0
+        return self.records / self.seconds
+
+    def __repr__(self):
+        return '<WorkerStats: {} records in {:.3f} s>'.format(
+            self.records, self.seconds)
+
+
+def load(cls, path, workers=None, ordered=True, on_error=None,
+         chunk_size=CHUNK_SIZE, stats=None):
+    """Iterate over models read from JSON Lines file.
+
+    Lines are decoded and models are created (with `cls(**data)`) and
+    validated in pool of processes, in chunks of lines. File is read lazily,
+    and only few chunks per process are processed at once.
+
+    :param cls: Model class.
+    :param str path: Path to file.
+    :param int workers: Number of processes (number of CPUs by default). If
+        it is 0, lines are processed in current process.
+    :param bool ordered: If `False`, models may be returned in different
+        order than they are in file (but sooner).
+    :param on_error: If given, it is called with
+        :class:`jsonmodels.errors.ItemValidationError` (with offset of line
+        in file) for each invalid record, and invalid records are skipped.
+        Otherwise the error is raised.
+    :param int chunk_size: Number of lines sent to process at once.
+    :param dict stats: If given, it is filled with
+        :class:`WorkerStats` of each process (by its id).
+    :raises ValueError: If any line is not valid JSON.
+
+    """
+    with io.open(path, 'rb') as stream:
+        chunks = (
+            (cls, lines)
+            for lines in _split(_lines_with_offsets(stream), chunk_size))
+        for models in _map(_load_chunk, chunks, workers, ordered, stats):
+            for model in models:
+                if not isinstance(model, ItemValidationError):
+                    yield model
+                elif on_error is None:
+                    raise model
+                else:
+                    on_error(model)
+
+
+def dump(models, path, workers=None, ordered=True, chunk_size=CHUNK_SIZE,
+         stats=None):
+    """Write models to JSON Lines file.
+
+    Models are validated and casted to JSON (with
+    :meth:`jsonmodels.models.Base.to_json`) in pool of processes, in chunks.
+    Models are taken from iterable lazily, and only few chunks per process
+    are processed at once.
+
+    :param models: Iterable of models.
+    :param str path: Path to file.
+    :param int workers: Number of processes, see :func:`load`.
+    :param bool ordered: If `False`, models may be written in different order
+        than they are given.
+    :param int chunk_size: Number of models sent to process at once.
+    :param dict stats: If given, it is filled with
+        :class:`WorkerStats` of each process (by its id).
+
+    """
+    with io.open(path, 'wb') as stream:
+        chunks = ((chunk,) for chunk in _split(models, chunk_size))
+        for text in _map(_dump_chunk, chunks, workers, ordered, stats):
+            stream.write(text)
+
+
+def _lines_with_offsets(stream):
+    offset = 0
+    for line in stream:
+        if line.strip():
+            yield offset, line
+        offset += len(line)
+
+
+def _split(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _load_chunk(cls, lines):
+    start = timeit.default_timer()
+    models = [_load_line(cls, offset, line) for offset, line in lines]
+    return os.getpid(), len(models), timeit.default_timer() - start, models
+
+
+def _load_line(cls, offset, line):
+    try:
+        data = json.loads(line.decode('utf-8'))
+    except ValueError:
+        raise ValueError('Invalid JSON at offset {}.'.format(offset))
+
+    try:
+        if not isinstance(data, dict):
+            raise ValidationError(errors.NOT_DICT, data)
+        model = cls(**data)
+        model.validate()
+    except ValidationError as error:
+        return ItemValidationError(offset, error)
+    return model
+
+
+def _dump_chunk(models):
+    start = timeit.default_timer()
+    text = u''.join(model.to_json() + u'\n' for model in models)
+    return (
+        os.getpid(), len(models), timeit.default_timer() - start,
+        text.encode('utf-8'))
+
+
+def _call(function, args):
+    """Call function, returning error instead of raising it."""
+    try:
+        return None, function(*args)
+    except Exception as error:
+        return error, None
+
+
+def _map(function, chunks, workers, ordered, stats):
+    """Call function for each of chunks of arguments and return payloads of
+    results, gathering stats of workers."""
+    if workers == 0:
+        results = (_call(function, args) for args in chunks)
+    else:
+        results = _map_in_pool(function, chunks, workers, ordered)
+
+    for error, result in results:
+        if error is not None:
+            raise error
+        worker, records, seconds, payload = result
+        if stats is not None:
+            worker_stats = stats.setdefault(worker, WorkerStats())
+            worker_stats.records += records
+            worker_stats.seconds += seconds
+        yield payload
+
+
+def _map_in_pool(function, chunks, workers, ordered):
+    pool = multiprocessing.Pool(workers)
+    limit = 2 * (workers or multiprocessing.cpu_count())
+    collect = _collect_ordered if ordered else _collect_unordered
+    try:
+        for result in collect(pool, function, chunks, limit):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _collect_ordered(pool, function, chunks, limit):
+    pending = collections.deque()
+    for args in chunks:
+        pending.append(pool.apply_async(_call, (function, args)))
+        if len(pending) >= limit:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _collect_unordered(pool, function, chunks, limit):
+    pending = []
+    for args in chunks:
+        pending.append(pool.apply_async(_call, (function, args)))
+        if len(pending) >= limit:
+            yield _pop_ready(pending)
+    while pending:
+        yield _pop_ready(pending)
+
+
+def _pop_ready(pending):
+    """Wait for any of pending results and remove it from them."""
+    while True:
+        for index, result in enumerate(pending):
+            if result.ready():
+                return pending.pop(index).get()
+        pending[0].wait(0.01)
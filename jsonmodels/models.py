@@ -1,51 +1,433 @@
+import copy
+import json
+
 import six
 
-from . import parsers, errors
-from .fields import BaseField
+from . import parsers, errors, compilers, streams, jsonl, views
+from .fields import (
+    BaseField, ValidationRecord, shallow_validation, is_deferred_validation,
+    deferred_validation, forget_validations)
+
+#: Default limit of errors collected by :meth:`Base.validate` (and
+#: :meth:`Base.from_struct`) with `collect` option.
+MAX_COLLECTED_ERRORS = 100
+
+
+def _bind_field(field, owner, name, slot=None):
+    """Bind field to model and name (and slot) under which its values are
+    stored.
+
+    Field that is already bound to different name or slot (so it is shared
+    between models) is copied, so values stored by each of them don't
+    collide.
+
+    """
+    if field.name is not None and (field.name, field.slot) != (name, slot):
+        field = copy.copy(field)
+    field.owner = owner
+    field.name = name
+    field.slot = slot
+    return field
+
+
+def get_option(cls, name, default=None):
+    """Get option of model, declared in its `Meta` class.
+
+    :param cls: Model class.
+    :param str name: Name of option.
+    :param default: Value returned, when option is not declared.
+
+    """
+    return getattr(getattr(cls, 'Meta', None), name, default)
+
+
+def _get_declared_option(bases, attributes, name, default=None):
+    """Get option of model that is not created yet."""
+    meta = attributes.get('Meta')
+    for base in bases:
+        if meta is not None:
+            break
+        meta = getattr(base, 'Meta', None)
+    return getattr(meta, name, default)
+
+
+def _can_change_in_place(field):
+    """Check if value of field can change without being assigned."""
+    return (
+        type(field).validate_changes_for_object !=
+        BaseField.validate_changes_for_object)
+
+
+def _has_weakref_slot(bases):
+    return any(base.__weakrefoffset__ for base in bases)
+
+
+class _EnoughErrors(Exception):
+
+    pass
+
+
+class _ErrorCollector(object):
+
+    """Collector of validation errors of tree of models, with paths of
+    invalid values (like `orders[3].items[0].price`)."""
+
+    def __init__(self, max_errors):
+        self.max_errors = max_errors
+        self.errors = []
+
+    def add(self, path, error):
+        self.errors.append(errors.FieldValidationError(path, error))
+        if len(self.errors) >= self.max_errors:
+            raise _EnoughErrors()
+
+    def collect(self, value, path=''):
+        """Collect errors of fields of value, if it is model."""
+        if not isinstance(value, Base):
+            return
+
+        prefix = path + '.' if path else ''
+        for name, field in value:
+            field.collect_errors(
+                field.__get__(value), prefix + name, self)
 
+    def collect_all(self, model):
+        try:
+            with deferred_validation():
+                self.collect(model)
+        except _EnoughErrors:
+            pass
+        return self.errors
+
+
+class JsonmodelMeta(type):
+
+    """Metaclass for models.
+
+    Binds fields to their attribute names (or slots, if model declares
+    `slots` option) and keeps registry of fields of each model (in order of
+    their creation), so it doesn't have to be computed every time fields are
+    iterated. It also compiles functions specialized for model, if model
+    requests that in its options.
+
+    """
+
+    def __new__(mcs, name, bases, attributes):
+        fields = dict(
+            (attr, value) for attr, value in attributes.items()
+            if isinstance(value, BaseField))
+        slotted = _get_declared_option(bases, attributes, 'slots', False)
+
+        if slotted:
+            attributes = dict(
+                (attr, value) for attr, value in attributes.items()
+                if attr not in fields)
+            slots = tuple(attributes.get('__slots__', ())) + tuple(fields)
+            if not _has_weakref_slot(bases):
+                slots += ('__weakref__',)
+            attributes['__slots__'] = slots
+
+        cls = super(JsonmodelMeta, mcs).__new__(mcs, name, bases, attributes)
+        for attr, field in fields.items():
+            slot = cls.__dict__[attr] if slotted else None
+            type.__setattr__(cls, attr, _bind_field(field, cls, attr, slot))
+        return cls
+
+    def __init__(cls, name, bases, attributes):
+        super(JsonmodelMeta, cls).__init__(name, bases, attributes)
+        cls._refresh_fields()
+
+    def __setattr__(cls, name, value):
+        if isinstance(value, BaseField):
+            if not cls.__dictoffset__:
+                raise TypeError(
+                    'Fields can not be added to models with slots.')
+            value = _bind_field(value, cls, name)
+        refresh = cls._is_field(name) or isinstance(value, BaseField)
+        super(JsonmodelMeta, cls).__setattr__(name, value)
+        if refresh:
+            forget_validations()
+            cls._refresh_fields()
+
+    def __delattr__(cls, name):
+        refresh = cls._is_field(name)
+        super(JsonmodelMeta, cls).__delattr__(name)
+        if refresh:
+            forget_validations()
+            cls._refresh_fields()
+
+    def _is_field(cls, name):
+        return isinstance(cls.__dict__.get(name), BaseField)
 
+    def _collect_fields(cls):
+        found = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, BaseField):
+                    found[name] = value
+                else:
+                    found.pop(name, None)
+
+        for name, field in list(found.items()):
+            if field.name != name:
+                # Field declared in class that is not model (like mixin) is
+                # bound to model, which inherits it.
+                field = _bind_field(copy.copy(field), cls, name)
+                type.__setattr__(cls, name, field)
+                found[name] = field
+
+        type.__setattr__(cls, '_fields', tuple(sorted(
+            found.items(), key=lambda item: item[1].creation_order)))
+        type.__setattr__(cls, '_fields_index', found)
+        type.__setattr__(cls, '_changeable_fields', tuple(
+            (name, field) for name, field in cls._fields
+            if _can_change_in_place(field)))
+
+    def _compile(cls):
+        type.__setattr__(cls, '_deferred_validation', bool(
+            get_option(cls, 'deferred_validation', False)))
+        populate = None
+        if get_option(cls, 'compile_populate', False):
+            populate = compilers.compile_populate(cls)
+        type.__setattr__(cls, '_compiled_populate', populate)
+        type.__setattr__(cls, '_compiled_to_struct', None)
+        type.__setattr__(cls, '_compiled_from_struct', None)
+        type.__setattr__(cls, '_compiled_construct', None)
+        type.__setattr__(cls, '_view_fields', None)
+
+    def _refresh_fields(cls):
+        cls._collect_fields()
+        cls._compile()
+        for subclass in cls.__subclasses__():
+            subclass._refresh_fields()
+
+
+@six.add_metaclass(JsonmodelMeta)
 class Base(object):
 
     """Base class for all models."""
 
+    __slots__ = ('_validation_record',)
+
     def __init__(self, **kwargs):
         self.populate(**kwargs)
 
     def populate(self, **kw):
         """Populate values to fields. Skip non-existing."""
-        for name, field in self:
+        if self._compiled_populate is not None:
+            return self._compiled_populate(kw)
+
+        for name, field in self._fields:
             if name in kw:
                 field.__set__(self, kw[name])
 
-    def get_field(self, field_name):
+    @classmethod
+    def from_struct(cls, data, collect=False, max_errors=None):
+        """Create model from Python structure (like decoded JSON).
+
+        The same as `cls(**data)`, but embedded models are created directly
+        from their dicts, with loaders compiled for their classes.
+
+        :param bool collect: If `True`, values are validated after whole
+            tree of models is created, and all errors (see :meth:`validate`)
+            are raised at once.
+        :param int max_errors: Limit of collected errors.
+        :raises jsonmodels.errors.AggregatedValidationError: With collected
+            errors.
+
+        """
+        if not isinstance(data, dict):
+            raise errors.ValidationError(errors.NOT_DICT, data)
+        if collect:
+            with deferred_validation():
+                model = compilers.get_trusted_loader(cls)(data)
+            found = model.validate(collect=True, max_errors=max_errors)
+            if found:
+                raise errors.AggregatedValidationError(found)
+            return model
+        if is_deferred_validation():
+            return compilers.get_trusted_loader(cls)(data)
+        return compilers.get_loader(cls)(data)
+
+    @classmethod
+    def from_trusted_struct(cls, data):
+        """Create model from trusted Python structure, without validation.
+
+        **Unsafe**: values (also of embedded models) are only parsed, their
+        types and validators are not checked at all, so this should be used
+        only for data that is known to be valid (like data of model, that was
+        casted to struct before). Invalid data results in invalid model.
+
+        """
+        return compilers.get_trusted_loader(cls)(data)
+
+    @classmethod
+    def construct(cls, **data):
+        """Create model from trusted values, without validation.
+
+        **Unsafe**, see :meth:`from_trusted_struct`.
+
+        """
+        return compilers.get_trusted_loader(cls)(data)
+
+    @classmethod
+    def from_json(cls, text, **options):
+        """Create model from JSON (string or UTF-8 encoded bytes).
+
+        Options are passed to :meth:`from_struct`.
+
+        """
+        if isinstance(text, six.binary_type):
+            text = text.decode('utf-8')
+        return cls.from_struct(json.loads(text), **options)
+
+    @classmethod
+    def iter_from_file(cls, fp, on_error=None):
+        """Iterate over models read from file with JSON array.
+
+        See :func:`jsonmodels.streams.iter_models`.
+
+        """
+        return streams.iter_models(cls, fp, on_error)
+
+    @classmethod
+    def load_jsonl(cls, path, **options):
+        """Iterate over models read from JSON Lines file.
+
+        See :func:`jsonmodels.jsonl.load`.
+
+        """
+        return jsonl.load(cls, path, **options)
+
+    @classmethod
+    def dump_jsonl(cls, models, path, **options):
+        """Write models to JSON Lines file.
+
+        See :func:`jsonmodels.jsonl.dump`.
+
+        """
+        jsonl.dump(models, path, **options)
+
+    @classmethod
+    def view(cls, data):
+        """Create read-only view of model over its Python structure.
+
+        See :class:`jsonmodels.views.ModelView`.
+
+        """
+        return views.ModelView(cls, data)
+
+    @classmethod
+    def map_file(cls, path):
+        """Map file with records of model to memory.
+
+        See :class:`jsonmodels.views.MappedRecords`.
+
+        """
+        return views.MappedRecords(cls, path)
+
+    @classmethod
+    def get_field(cls, field_name):
         """Get field associated with given attribute."""
-        for attr_name, field in self:
-            if field_name == attr_name:
-                return field
+        try:
+            return cls._fields_index[field_name]
+        except KeyError:
+            raise errors.FieldNotFound('Field not found', field_name)
+
+    @classmethod
+    def get_fields(cls, *field_names):
+        """Get fields associated with given attributes.
 
-        raise errors.FieldNotFound('Field not found', field_name)
+        :rtype: ``list``
+
+        """
+        return [cls.get_field(name) for name in field_names]
 
     def __iter__(self):
         """Iterate through fields and values."""
-        for name, field in self.iterate_over_fields():
-            yield name, field
+        return iter(self._fields)
+
+    def validate(self, collect=False, max_errors=None):
+        """Explicitly validate all the fields.
+
+        Model remembers that it was validated, so next time only fields
+        assigned since then (and lists changed since then, and embedded
+        models, in the same way) are validated.
 
-    def validate(self):
-        """Explicitly validate all the fields."""
-        for _, field in self:
-            field.validate_for_object(self)
+        :param bool collect: If `True`, whole tree of models (including
+            models in lists) is validated, and errors are returned instead of
+            raising first one. Each of them is
+            :class:`jsonmodels.errors.FieldValidationError` with path of
+            invalid value (like `orders[3].items[0].price`) in `field_name`
+            attribute.
+        :param int max_errors: Limit of collected errors (by default
+            :data:`MAX_COLLECTED_ERRORS`).
+        :rtype: ``list`` (only if errors are collected)
+        :raises jsonmodels.errors.FieldValidationError: With name of field
+            that is invalid.
+
+        """
+        if collect:
+            if max_errors is None:
+                max_errors = MAX_COLLECTED_ERRORS
+            return _ErrorCollector(max_errors).collect_all(self)
+
+        record = getattr(self, '_validation_record', None)
+        if record is None or not record.is_current():
+            self._validate_fields(self._fields)
+        else:
+            self._validate_changes(record.changed)
+        self._validation_record = ValidationRecord()
+
+    def _validate_fields(self, fields):
+        for name, field in fields:
+            try:
+                field.validate_for_object(self)
+            except errors.ValidationError as error:
+                raise errors.FieldValidationError(name, error)
+
+    def _validate_changes(self, changed):
+        if changed:
+            self._validate_fields(
+                [(name, field) for name, field in self._fields
+                 if name in changed])
+
+        for name, field in self._changeable_fields:
+            if name in changed:
+                continue
+            try:
+                field.validate_changes_for_object(self)
+            except errors.ValidationError as error:
+                raise errors.FieldValidationError(name, error)
 
     @classmethod
     def iterate_over_fields(cls):
         """Iterate through fields and values."""
-        for attr in dir(cls):
-            clsattr = getattr(cls, attr)
-            if isinstance(clsattr, BaseField):
-                yield attr, clsattr
+        return iter(cls._fields)
 
     def to_struct(self):
         """Cast model to Python structure."""
-        return parsers.to_struct(self)
+        if not compilers.USE_COMPILED_SERIALIZERS:
+            return parsers.to_struct(self)
+
+        with shallow_validation():
+            return compilers.get_serializer(type(self))(self)
+
+    def to_json(self, **kwargs):
+        """Cast model to JSON.
+
+        See :func:`jsonmodels.parsers.to_json`.
+
+        """
+        return parsers.to_json(self, **kwargs)
+
+    def dump(self, fp, **kwargs):
+        """Write model as JSON to file-like object.
+
+        See :func:`jsonmodels.parsers.dump`.
+
+        """
+        parsers.dump(self, fp, **kwargs)
 
     @classmethod
     def to_json_schema(cls):
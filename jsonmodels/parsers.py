@@ -1,15 +1,26 @@
 """Parsers to change model structure into different ones."""
 
+import json
+
 from . import fields
 
+_INFINITY = float('inf')
+
 
 def to_struct(model):
     """Cast instance of model to python structure.
 
+    Each model in tree is validated exactly once, just before it is casted.
+
     :param model: Model to be casted.
     :rtype: ``dict``
 
     """
+    with fields.shallow_validation():
+        return _to_struct(model)
+
+
+def _to_struct(model):
     from .models import Base
 
     if not isinstance(model, Base):
@@ -24,12 +35,130 @@ def to_struct(model):
             continue
 
         if isinstance(value, list):
-            resp[name] = [to_struct(item) for item in value]
+            resp[name] = [_to_struct(item) for item in value]
+        elif isinstance(field, fields.EmbeddedField):
+            resp[name] = field.add_discriminator(_to_struct(value), value)
         else:
-            resp[name] = to_struct(value)
+            resp[name] = _to_struct(value)
     return resp
 
 
+def to_json(model, **kwargs):
+    """Cast instance of model to JSON.
+
+    Result is the same as Python structure of model (see :func:`to_struct`)
+    encoded to JSON, except that values of fields are casted with `to_struct`
+    method of their field (so for example dates are casted to strings).
+
+    :param model: Model to be casted.
+    :param kwargs: Options of `json.JSONEncoder` used to encode values
+        (indentation is not supported).
+    :rtype: ``str``
+
+    """
+    chunks = []
+    with fields.shallow_validation():
+        _JsonWriter(chunks.append, kwargs).write(model)
+    return ''.join(chunks)
+
+
+def dump(model, fp, **kwargs):
+    """Write instance of model as JSON to file-like object.
+
+    JSON is written in chunks while walking through tree of models, so Python
+    structure of whole model is never built. Each model in tree is validated
+    just before it is written, so if any model is invalid, part of JSON may
+    already be written. See :func:`to_json` for details.
+
+    :param model: Model to be written.
+    :param fp: File-like object, opened in text mode.
+
+    """
+    with fields.shallow_validation():
+        _JsonWriter(fp.write, kwargs).write(model)
+
+
+class _JsonWriter(object):
+
+    """Writes JSON of models tree in chunks to given function."""
+
+    def __init__(self, write, options):
+        from .models import Base
+
+        if options.get('indent') is not None:
+            raise ValueError('Indentation is not supported.')
+        self.emit = write
+        self.encoder = json.JSONEncoder(**options)
+        self.encode = self.encoder.encode
+        self.item_separator = self.encoder.item_separator
+        self.key_separator = self.encoder.key_separator
+        self.names = {}
+        self.model_type = Base
+
+    def write(self, value, field=None):
+        if isinstance(value, self.model_type):
+            self.write_model(value, field)
+        elif isinstance(value, list):
+            self.write_list(value)
+        else:
+            if field is not None:
+                value = field.to_struct(value)
+            self.emit(self.encode_value(value))
+
+    def write_model(self, model, field=None):
+        model.validate()
+
+        separator = '{'
+        if isinstance(field, fields.EmbeddedField):
+            discriminator = field.get_discriminator(model)
+            if discriminator is not None:
+                self.emit(separator + self.encode_name(field.discriminator))
+                self.emit(self.encode_value(discriminator))
+                separator = self.item_separator
+
+        for name, field in model:
+            value = field.__get__(model)
+            if value is None:
+                continue
+
+            self.emit(separator + self.encode_name(name))
+            separator = self.item_separator
+            self.write(value, field)
+
+        self.emit('{}' if separator == '{' else '}')
+
+    def write_list(self, values):
+        separator = '['
+        for value in values:
+            self.emit(separator)
+            separator = self.item_separator
+            self.write(value)
+
+        self.emit('[]' if separator == '[' else ']')
+
+    def encode_name(self, name):
+        try:
+            return self.names[name]
+        except KeyError:
+            encoded = self.names[name] = (
+                self.encode(name) + self.key_separator)
+            return encoded
+
+    def encode_value(self, value):
+        # `JSONEncoder.encode` builds whole encoder for anything other than
+        # string, so simple values are encoded here (`long` of Python 2 is
+        # left to encoder, as its `repr` ends with 'L').
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if type(value) is int:
+            return int.__repr__(value)
+        if type(value) is float and -_INFINITY < value < _INFINITY:
+            return repr(value)
+        return self.encode(value)
+
+
 def to_json_schema(cls):
     """Generate JSON schema for given class.
 
@@ -107,8 +236,28 @@ def _specify_field_type(field):
 
 def _parse_embedded(field):
     types = field.types
+    if field.types_by_discriminator is not None:
+        return {'oneOf': [
+            _discriminated_schema(field, cls) for cls in types]}
     if len(types) == 1:
         cls = types[0]
         return cls.to_json_schema()
     else:
         return {'oneOf': [cls.to_json_schema() for cls in types]}
+
+
+def _discriminated_schema(field, cls):
+    """Generate schema of model type, requiring discriminator to be equal to
+    one of values mapped to it."""
+    schema = cls.to_json_schema()
+    name = field.discriminator
+    values = [
+        value for value, type_ in field.types_by_discriminator.items()
+        if type_ is cls]
+
+    properties = schema.setdefault('properties', {})
+    properties[name] = dict(properties.get(name, {}), enum=values)
+    required = schema.setdefault('required', [])
+    if name not in required:
+        required.append(name)
+    return schema
@@ -0,0 +1,181 @@
+"""Reading models from streams of JSON."""
+
+import codecs
+import json
+import re
+
+import six
+
+from .errors import ItemValidationError, ValidationError
+
+#: Amount of data read from stream at once.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITER = re.compile(r'[ \t\n\r,\]]')
+#: Longest part of token (like '-Infinity') that can't be decoded alone.
+_TOKEN_SIZE = len('-Infinity')
+
+
+class _Scanner(object):
+
+    """Reads stream in chunks and keeps offset of current position in it.
+
+    Offset is counted in bytes for binary streams (which are decoded as
+    UTF-8) and in characters for text streams.
+
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = u''
+        self.index = 0
+        self.offset = 0
+        self.binary = False
+        self.eof = False
+
+    def read(self, size):
+        """Read more data to buffer, dropping part that is already read."""
+        data = self.fp.read(size)
+        self.eof = not data
+        if isinstance(data, six.binary_type):
+            self.binary = True
+            data = self.decoder.decode(data, final=self.eof)
+        self.buffer = self.buffer[self.index:] + data
+        self.index = 0
+
+    def advance(self, index):
+        consumed = self.buffer[self.index:index]
+        if self.binary:
+            self.offset += len(consumed.encode('utf-8'))
+        else:
+            self.offset += len(consumed)
+        self.index = index
+
+    def peek(self):
+        """Skip whitespace and return next character (empty at the end)."""
+        while True:
+            self.advance(_WHITESPACE.match(self.buffer, self.index).end())
+            if self.index < len(self.buffer) or self.eof:
+                return self.buffer[self.index:self.index + 1]
+            self.read(self.chunk_size)
+
+    def expect(self, characters):
+        character = self.peek()
+        if not character or character not in characters:
+            self.fail()
+        self.advance(self.index + 1)
+        return character
+
+    def decode(self, decoder):
+        """Decode next value, reading as much data as it needs."""
+        size = self.chunk_size
+        while True:
+            if self.is_complete():
+                try:
+                    value, end = decoder.raw_decode(self.buffer, self.index)
+                except ValueError as error:
+                    if not self.is_truncated(error):
+                        self.fail()
+                    value, end = None, None
+                if end is not None:
+                    self.advance(end)
+                    return value
+            if self.eof:
+                self.fail()
+            self.read(size)
+            size *= 2
+
+    def is_complete(self):
+        """Check if next value may be decoded from buffer.
+
+        Values other than objects, arrays and strings (like numbers) can be
+        decoded only when they are followed by delimiter, otherwise only part
+        of them could be decoded.
+
+        """
+        if self.eof or self.buffer[self.index:self.index + 1] in '{["':
+            return True
+        return _DELIMITER.search(self.buffer, self.index) is not None
+
+    def is_truncated(self, error):
+        """Check if error of decoding can be caused by end of buffer (and not
+        by invalid JSON), so more data has to be read.
+
+        Only errors at the last characters of buffer (which can be part of
+        token, like 'tr' of 'true') or of unterminated strings are. Other
+        errors fail at once, so rest of stream is not read to memory.
+
+        """
+        position = getattr(error, 'pos', None)
+        if position is None:
+            # Python 2 doesn't tell where the error is.
+            return True
+        return (
+            len(self.buffer) - position < _TOKEN_SIZE or
+            error.msg.startswith('Unterminated string'))
+
+    def fail(self):
+        raise ValueError('Invalid JSON at offset {}.'.format(self.offset))
+
+
+def iter_array(fp, chunk_size=CHUNK_SIZE):
+    """Iterate over items of JSON array, read from stream incrementally.
+
+    Only the item being decoded is kept in memory, so arrays of any size can
+    be read.
+
+    :param fp: File-like object (opened in binary mode, with UTF-8 encoded
+        JSON, or in text mode).
+    :param int chunk_size: Amount of data read from stream at once.
+    :return: Generator of 2-tuples with offset of item in stream (in bytes
+        for binary streams and in characters for text streams) and item.
+    :raises ValueError: If stream doesn't contain valid JSON array.
+
+    """
+    scanner = _Scanner(fp, chunk_size)
+    decoder = json.JSONDecoder()
+
+    scanner.expect('[')
+    if scanner.peek() == ']':
+        scanner.advance(scanner.index + 1)
+    else:
+        while True:
+            scanner.peek()
+            offset = scanner.offset
+            yield offset, scanner.decode(decoder)
+            if scanner.expect(',]') == ']':
+                break
+
+    if scanner.peek():
+        scanner.fail()
+
+
+def iter_models(cls, fp, on_error=None, chunk_size=CHUNK_SIZE):
+    """Iterate over models read from stream with JSON array of their structs.
+
+    Each model is validated before it is returned. Models are read with
+    :func:`iter_array`, so only one of them is kept in memory.
+
+    :param cls: Model class.
+    :param fp: File-like object, see :func:`iter_array`.
+    :param on_error: If given, it is called with
+        :class:`jsonmodels.errors.ItemValidationError` for each invalid item,
+        and invalid items are skipped. Otherwise the error is raised.
+    :param int chunk_size: Amount of data read from stream at once.
+    :raises ValueError: If stream doesn't contain valid JSON array.
+
+    """
+    for offset, item in iter_array(fp, chunk_size):
+        try:
+            model = cls.from_struct(item)
+            model.validate()
+        except ValidationError as error:
+            error = ItemValidationError(offset, error)
+            if on_error is None:
+                raise error
+            on_error(error)
+            continue
+        yield model
@@ -1,8 +1,12 @@
 from __future__ import absolute_import
 
+import datetime
 import six
 import re
-from collections import namedtuple
+import threading
+from collections import namedtuple, OrderedDict
+
+from dateutil.tz import tzoffset, tzutc
 
 SCALAR_TYPES = tuple(list(six.string_types) + [int, float, bool])
 
@@ -16,6 +20,15 @@ PYTHON_TO_ECMA_FLAGS = {
 
 PythonRegex = namedtuple('PythonRegex', ['regex', 'flags'])
 
+_ISO_8601_TIME = (
+    r'([0-9]{2}):([0-9]{2})'
+    r'(?::([0-9]{2})(?:[.,]([0-9]+))?)?'
+    r'(Z|[+-][0-9]{2}(?::?[0-9]{2})?)?')
+ISO_8601_DATETIME = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+    r'(?:[T ]' + _ISO_8601_TIME + r')?\Z')
+ISO_8601_TIME = re.compile(_ISO_8601_TIME + r'\Z')
+
 
 def _normalize_string_type(value):
     if isinstance(value, six.string_types):
@@ -152,3 +165,142 @@ def convert_python_regex_to_ecma(value, flags=[]):
     result_flags = ''.join(result_flags)
 
     return '/{}/{}'.format(value, result_flags)
+
+
+_offsets = {'Z': tzutc()}
+
+
+def _parse_offset(offset):
+    if offset is None:
+        return None
+
+    try:
+        return _offsets[offset]
+    except KeyError:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        minutes = int(digits[:2]) * 60 + int(digits[2:] or 0)
+        tzinfo = _offsets[offset] = tzoffset(None, sign * minutes * 60)
+        return tzinfo
+
+
+def _parse_time(hour, minute, second, fraction, offset):
+    return (
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(fraction[:6].ljust(6, '0')) if fraction else 0,
+        _parse_offset(offset),
+    )
+
+
+def parse_iso8601_datetime(value):
+    """Parse ISO 8601 string with date (and optionally time) to datetime.
+
+    Only most common forms are recognized - extended date (`YYYY-MM-DD`),
+    optionally followed (after `T` or space) by time with optional seconds,
+    fraction of second and UTC offset.
+
+    :param string value: Value to parse.
+    :return: Parsed value or `None`, if value is not in recognized form.
+    :rtype: `datetime.datetime`
+    :raises ValueError: If value has right form, but it is out of range.
+
+    """
+    if not isinstance(value, six.string_types):
+        return None
+
+    match = ISO_8601_DATETIME.match(value)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    return datetime.datetime(
+        int(year), int(month), int(day),
+        *_parse_time(hour, minute, second, fraction, offset))
+
+
+def parse_iso8601_time(value):
+    """Parse ISO 8601 string with time to time.
+
+    Recognizes the same forms of time as :func:`parse_iso8601_datetime`.
+
+    :param string value: Value to parse.
+    :return: Parsed value or `None`, if value is not in recognized form.
+    :rtype: `datetime.time`
+    :raises ValueError: If value has right form, but it is out of range.
+
+    """
+    if not isinstance(value, six.string_types):
+        return None
+
+    match = ISO_8601_TIME.match(value)
+    if match is None:
+        return None
+
+    return datetime.time(*_parse_time(*match.groups()))
+
+
+class LRUCache(object):
+
+    """Bounded cache, that discards least recently used items.
+
+    Hits and misses of :meth:`get` are counted in `hits` and `misses`
+    attributes.
+
+    """
+
+    def __init__(self, maxsize=1024):
+        """Init.
+
+        :param int maxsize: Maximal number of items kept in cache.
+
+        """
+        if maxsize < 1:
+            raise ValueError('Size of cache must be positive.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get item from cache (and mark it as recently used)."""
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items[key] = value
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Remove all items from cache and reset counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
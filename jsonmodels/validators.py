@@ -1,13 +1,12 @@
 """Predefined validators."""
 
+import itertools
 import re
-try:
-    from functools import reduce
-except ImportError:
-    pass
 
+import six
+
+from . import errors, utilities
 from .errors import ValidationError
-from . import utilities
 
 
 class Min(object):
@@ -30,13 +29,11 @@ class Min(object):
         if self.exclusive:
             if value <= self.minimum_value:
                 raise ValidationError(
-                    "'{}' is lower or equal than minimum ('{}').".format(
-                        value, self.minimum_value))
+                    errors.MIN_EXCLUSIVE, value, self.minimum_value)
         else:
             if value < self.minimum_value:
                 raise ValidationError(
-                    "'{}' is lower than minimum ('{}').".format(
-                        value, self.minimum_value))
+                    errors.MIN, value, self.minimum_value)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -65,13 +62,11 @@ class Max(object):
         if self.exclusive:
             if value >= self.maximum_value:
                 raise ValidationError(
-                    "'{}' is bigger or equal than maximum ('{}').".format(
-                        value, self.maximum_value))
+                    errors.MAX_EXCLUSIVE, value, self.maximum_value)
         else:
             if value > self.maximum_value:
                 raise ValidationError(
-                    "'{}' is bigger than maximum ('{}').".format(
-                        value, self.maximum_value))
+                    errors.MAX, value, self.maximum_value)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -89,14 +84,19 @@ class Regex(object):
         'multiline': re.M,
     }
 
-    def __init__(self, pattern, **flags):
+    def __init__(self, pattern, full_match=False, **flags):
         """Init.
 
         Note, that if given pattern is ECMA regex, given flags will be
         **completely ignored** and taken from given regex.
 
+        Pattern is compiled once, here.
 
         :param string pattern: Pattern of regex.
+        :param bool full_match: If `True`, whole value must match pattern
+            (otherwise it is enough if pattern is found anywhere in value).
+            It can't be used with `multiline` flag, as anchors of ECMA regex
+            in schema would match at lines then.
         :param dict flags: Allowed flags can be found in attribute
             `ATTRIBUTES_TO_FLAGS`. Invalid flags will be ignored.
 
@@ -118,28 +118,41 @@ class Regex(object):
         self.flags = [
             self.FLAGS[key] for key, value
             in flags.items() if value]
+        self.full_match = full_match
+        if full_match and re.M in self.flags:
+            raise ValueError(
+                "'full_match' can not be used with 'multiline' flag.")
+
+        compiled_flags = 0
+        for flag in self.flags:
+            compiled_flags |= flag
+
+        if full_match:
+            self.regex = re.compile(
+                r'(?:{})\Z'.format(self.pattern), compiled_flags)
+            self._find = self.regex.match
+        else:
+            self.regex = re.compile(self.pattern, compiled_flags)
+            self._find = self.regex.search
 
     def validate(self, value):
         """Validate value."""
-        flags = self._calculate_flags()
-
         try:
-            result = re.search(self.pattern, value, flags)
+            result = self._find(value)
         except TypeError as te:
             raise ValidationError(*te.args)
 
         if not result:
             raise ValidationError(
-                'Value "{}" did not match pattern "{}".'.format(
-                    value, self.pattern))
-
-    def _calculate_flags(self):
-        return reduce(lambda x, y: x | y, self.flags, 0)
+                errors.NO_MATCH, value, self.pattern)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
+        pattern = self.pattern
+        if self.full_match:
+            pattern = '^(?:{})$'.format(pattern)
         field_schema['pattern'] = utilities.convert_python_regex_to_ecma(
-            self.pattern, self.flags)
+            pattern, self.flags)
 
 
 class Length(object):
@@ -169,14 +182,11 @@ class Length(object):
 
         if self.minimum_value is not None and len_ < self.minimum_value:
             raise ValidationError(
-                "Value '{}' length is lower than allowed minimum '{}'.".format(
-                    value, self.minimum_value))
+                errors.TOO_SHORT, value, self.minimum_value)
 
         if self.minimum_value is not None and len_ > self.maximum_value:
             raise ValidationError(
-                "Value '{}' length is bigger than "
-                "allowed maximum '{}'.".format(
-                    value, self.maximum_value))
+                errors.TOO_LONG, value, self.maximum_value)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -191,25 +201,51 @@ class Value(object):
 
     """Validator for allowed values."""
 
+    #: Maximum number of allowed values listed in message of error.
+    VALUES_IN_MESSAGE = 10
+
     def __init__(self, allowed_values=None):
         """Init.
+
+        Hashable values are put into set (so checking them takes constant
+        time), only unhashable ones are compared one by one.
+
         :param list allowed_values: List of all allowed values (required).
-        """
 
+        """
         if allowed_values is None:
             raise ValueError(
                 "'allowed_values' must be specified.")
 
         self.allowed_values = allowed_values
+        self._hashable = set()
+        self._unhashable = []
+        for allowed in allowed_values:
+            try:
+                self._hashable.add(allowed)
+            except TypeError:
+                self._unhashable.append(allowed)
 
     def validate(self, value):
         """Validate value."""
+        try:
+            if value in self._hashable:
+                return
+            candidates = self._unhashable
+        except TypeError:
+            candidates = self.allowed_values
 
-        if value not in self.allowed_values:
+        if value not in candidates:
             raise ValidationError(
-                ("Value '%s' is not an allowed value. It should be equal " +
-                 "to one of the following values: '%s'.") 
-                 % (value, ', '.join(self.allowed_values)))
+                errors.NOT_ALLOWED, value, self._format_allowed_values)
+
+    def _format_allowed_values(self):
+        values = [
+            six.text_type(allowed) for allowed
+            in itertools.islice(self.allowed_values, self.VALUES_IN_MESSAGE)]
+        if len(self.allowed_values) > self.VALUES_IN_MESSAGE:
+            values.append('...')
+        return ', '.join(values)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -0,0 +1,247 @@
+"""Read-only, lazy views of models."""
+
+import array
+import json
+import mmap
+
+from . import errors, streams
+from .errors import ValidationError
+from .fields import EmbeddedField
+
+try:
+    array.array('q')
+    _OFFSET_TYPE = 'q'
+except ValueError:  # pragma: no cover
+    _OFFSET_TYPE = 'L'
+
+
+def _get_view_type(field):
+    """Get type of model, which view can be value of field (if any).
+
+    Only embedded models of single type are viewed lazily (and only if
+    field has no custom validators, which could expect model).
+
+    """
+    from .models import Base
+
+    if (type(field).parse_value == EmbeddedField.parse_value and
+            type(field).validate == EmbeddedField.validate and
+            len(field.types) == 1 and
+            issubclass(field.types[0], Base)):
+        return field.types[0]
+    return None
+
+
+def _get_fields(model_class):
+    """Get fields of model class, with types of their views, by names.
+
+    Result is cached on model class (until its fields change).
+
+    """
+    view_fields = model_class.__dict__.get('_view_fields')
+    if view_fields is None:
+        view_fields = dict(
+            (name, (field, _get_view_type(field)))
+            for name, field in model_class.iterate_over_fields())
+        type.__setattr__(model_class, '_view_fields', view_fields)
+    return view_fields
+
+
+class ModelView(object):
+
+    """Read-only view of model over its Python structure (like decoded JSON).
+
+    Value of field is parsed and validated (with `parse_value` and `validate`
+    methods of field) only when it is accessed for the first time, so fields
+    that are never accessed cost nothing. Embedded models (of single type)
+    are viewed lazily as well, so their values are views too.
+
+    """
+
+    __slots__ = ('_model_class', '_data', '_values')
+
+    def __init__(self, model_class, data):
+        """Init.
+
+        :param model_class: Model class.
+        :param dict data: Python structure of model.
+
+        """
+        if not isinstance(data, dict):
+            raise ValidationError(errors.NOT_DICT, data)
+        object.__setattr__(self, '_model_class', model_class)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_values', {})
+
+    def __getattr__(self, name):
+        if name in ModelView.__slots__:
+            # Attributes of view that is not initialized (like copied one).
+            raise AttributeError(name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        try:
+            field, view_type = _get_fields(self._model_class)[name]
+        except KeyError:
+            raise AttributeError(name)
+        return self._load(name, field, view_type)
+
+    def _load(self, name, field, view_type):
+        """Parse and validate value of field (or create view of it)."""
+        data = self._data
+        value = data[name] if name in data else field.get_default_value()
+        if (view_type is not None and not field.validators and
+                isinstance(value, dict)):
+            value = ModelView(view_type, value)
+        else:
+            value = field.parse_value(value)
+            field.validate(value)
+        self._values[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError('View of model is read-only.')
+
+    def __delattr__(self, name):
+        raise AttributeError('View of model is read-only.')
+
+    def __iter__(self):
+        """Iterate through fields and values."""
+        return self._model_class.iterate_over_fields()
+
+    def validate(self):
+        """Explicitly validate all the fields and embedded views."""
+        values = self._values
+        view_fields = _get_fields(self._model_class)
+        for name, _ in self._model_class.iterate_over_fields():
+            field, view_type = view_fields[name]
+            if name not in values:
+                value = self._load(name, field, view_type)
+            else:
+                value = values[name]
+                if not isinstance(value, ModelView):
+                    field.validate(value)
+
+            if isinstance(value, ModelView):
+                value.validate()
+
+    def to_model(self):
+        """Create model from data of view.
+
+        :rtype: Instance of model class of view.
+
+        """
+        return self._model_class.from_struct(self._data)
+
+    def to_struct(self):
+        """Cast view to Python structure (the same as model would be)."""
+        return self.to_model().to_struct()
+
+    def __repr__(self):
+        return '<{} view>'.format(self._model_class.__name__)
+
+
+class MappedRecords(object):
+
+    """Records of model in file, mapped to memory.
+
+    File can be in JSON Lines format, or contain single JSON array of records.
+    Offsets of records are found once, when file is opened, then any of them
+    can be accessed directly, as :class:`ModelView` (so only file pages that
+    contain record are read, and only fields that are accessed are parsed).
+
+    Finding offsets of records in JSON Lines file only looks for line breaks,
+    but records of JSON array have to be decoded to find where they end, so
+    opening such file reads (and decodes) all of it once.
+
+    Can be used as context manager, which closes file at exit.
+
+    """
+
+    def __init__(self, model_class, path):
+        """Init.
+
+        :param model_class: Model class.
+        :param str path: Path to file.
+        :raises ValueError: If file with JSON array is not valid JSON.
+
+        """
+        self.model_class = model_class
+        self.path = path
+        self._decoder = json.JSONDecoder()
+        self._file = open(path, 'rb')
+        try:
+            self._map = self._open_map()
+            self._offsets = self._index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _open_map(self):
+        self._file.seek(0, 2)
+        if not self._file.tell():
+            return b''
+        return mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index(self):
+        offsets = array.array(_OFFSET_TYPE)
+        if self._map[:1024].lstrip()[:1] == b'[':
+            self._map.seek(0)
+            offsets.extend(
+                offset for offset, _ in streams.iter_array(self._map))
+            return offsets
+
+        position = 0
+        size = len(self._map)
+        while position < size:
+            end = self._map.find(b'\n', position)
+            end = size if end == -1 else end + 1
+            # Offset of record is stored after leading whitespace, as
+            # decoder doesn't skip it.
+            record = self._map[position:end].lstrip()
+            if record:
+                offsets.append(end - len(record))
+            position = end
+        return offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        """Get view of record.
+
+        :param int index: Index of record.
+        :rtype: :class:`ModelView`
+
+        """
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError('Record index out of range.')
+
+        start = self._offsets[index]
+        end = (
+            self._offsets[index + 1] if index + 1 < len(self._offsets)
+            else len(self._map))
+        text = self._map[start:end].decode('utf-8')
+        data, _ = self._decoder.raw_decode(text)
+        return ModelView(self.model_class, data)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        """Close mapped file."""
+        if not isinstance(self._map, bytes):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
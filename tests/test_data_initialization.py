@@ -281,3 +281,93 @@ def test_deep_initialization_for_embed_field():
         car = parking.car
         assert isinstance(car, Car)
         assert car.brand == 'awesome brand'
+
+
+def test_compiled_initialization():
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+
+        class Meta:
+            compile_populate = True
+
+    class Parking(models.Base):
+
+        location = fields.StringField()
+        open = fields.BoolField()
+        car = fields.EmbeddedField(Car)
+        cars = fields.ListField(items_types=Car)
+
+        class Meta:
+            compile_populate = True
+
+    data = {
+        'location': 'somewhere',
+        'open': 1,
+        'car': {'brand': 'one'},
+        'cars': [{'brand': 'two'}, {'brand': 'three'}],
+        'trash': '123qwe',
+    }
+
+    parking1 = Parking(**data)
+    parking2 = Parking()
+    parking2.populate(**data)
+    for parking in [parking1, parking2]:
+        assert parking.location == 'somewhere'
+        assert parking.open is True
+        assert isinstance(parking.car, Car)
+        assert parking.car.brand == 'one'
+        assert ['two', 'three'] == [car.brand for car in parking.cars]
+        assert not hasattr(parking, 'trash')
+
+    with pytest.raises(errors.ValidationError):
+        Parking(location=42)
+
+    with pytest.raises(errors.ValidationError):
+        Parking(car={})
+
+
+def test_compiled_initialization_with_custom_field():
+
+    class UpperStringField(fields.StringField):
+
+        def __set__(self, obj, value):
+            super(UpperStringField, self).__set__(obj, value.upper())
+
+    class Person(models.Base):
+
+        name = UpperStringField()
+
+        class Meta:
+            compile_populate = True
+
+    person = Person(name='Alan')
+    assert person.name == 'ALAN'
+
+    Person.surname = fields.StringField()
+    person = Person(name='Alan', surname='Wake')
+    assert person.surname == 'Wake'
+
+
+def test_compiled_initialization_is_not_inherited():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+        class Meta:
+            compile_populate = True
+
+    class Employee(Person):
+
+        salary = fields.FloatField()
+
+        class Meta:
+            compile_populate = False
+
+    employee = Employee(name='Alan', salary=2.5)
+    assert employee.name == 'Alan'
+    assert employee.salary == 2.5
+    assert Employee._compiled_populate is None
+    assert Person._compiled_populate is not None
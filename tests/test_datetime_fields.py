@@ -1,9 +1,10 @@
 import datetime
 
 import pytest
+from dateutil.parser import parse
 from dateutil.tz import tzoffset
 
-from jsonmodels import models, fields
+from jsonmodels import models, fields, errors, utilities
 
 
 class _TestCet(datetime.tzinfo):
@@ -229,3 +230,143 @@ def test_datetime_field_parse_value():
 
     with pytest.raises(TypeError):
         field.parse_value('not a datetime')
+
+
+def test_datetime_field_parse_iso8601_forms():
+
+    field = fields.DateTimeField()
+
+    assert (
+        datetime.datetime(2014, 4, 21) == field.parse_value('2014-04-21'))
+    assert (
+        datetime.datetime(2014, 4, 21, 12, 45) ==
+        field.parse_value('2014-04-21T12:45')
+    )
+    assert (
+        datetime.datetime(2014, 4, 21, 12, 45, 56, 123000) ==
+        field.parse_value('2014-04-21 12:45:56.123')
+    )
+    assert (
+        datetime.datetime(2014, 4, 21, 12, 45, 56, 123456) ==
+        field.parse_value('2014-04-21T12:45:56,1234567')
+    )
+
+    value = field.parse_value('2014-04-21T12:45:56Z')
+    assert datetime.timedelta(0) == value.utcoffset()
+    value = field.parse_value('2014-04-21T12:45:56-0130')
+    assert datetime.timedelta(hours=-1, minutes=-30) == value.utcoffset()
+    value = field.parse_value('2014-04-21T12:45:56+02')
+    assert datetime.timedelta(hours=2) == value.utcoffset()
+
+
+def test_date_fields_parse_same_as_dateutil():
+
+    values = [
+        '2014-04-21',
+        '2014-04-21T12:45:56',
+        '2014-04-21T12:45:56.5+02:00',
+        '2014-04-21 12:45:56Z',
+    ]
+    for value in values:
+        expected = parse(value)
+        assert expected == fields.DateTimeField().parse_value(value)
+        assert expected.date() == fields.DateField().parse_value(value)
+        assert expected.timetz() == fields.TimeField().parse_value(value)
+
+    assert parse('12:45:56.5-01:00').timetz() == (
+        fields.TimeField().parse_value('12:45:56.5-01:00'))
+
+
+def test_date_fields_fall_back_to_dateutil():
+
+    assert (
+        datetime.datetime(2014, 4, 21, 12, 45) ==
+        fields.DateTimeField().parse_value('21 April 2014 12:45')
+    )
+    assert (
+        datetime.date(2014, 4, 21) ==
+        fields.DateField().parse_value('April 21, 2014')
+    )
+    assert (
+        datetime.time(2, 34, 45) ==
+        fields.TimeField().parse_value('2:34:45')
+    )
+
+
+def test_date_fields_in_strict_mode():
+
+    field = fields.DateTimeField(strict=True)
+    assert field.strict
+    assert (
+        datetime.datetime(2014, 4, 21, 12, 45, 56) ==
+        field.parse_value('2014-04-21T12:45:56')
+    )
+
+    invalid_values = [
+        (fields.DateTimeField(strict=True), '21 April 2014 12:45'),
+        (fields.DateTimeField(strict=True), '2014-13-21T12:45:56'),
+        (fields.DateField(strict=True), 'April 21, 2014'),
+        (fields.TimeField(strict=True), '2:34:45'),
+        (fields.TimeField(strict=True), 42),
+        # Full-width digits.
+        (fields.DateField(strict=True), u'\uff12\uff10\uff11\uff14-04-21'),
+        (fields.TimeField(strict=True), u'12:\uff14\uff15'),
+    ]
+    for field, value in invalid_values:
+        with pytest.raises(errors.ValidationError):
+            field.parse_value(value)
+
+
+def test_unset_date_fields_are_none():
+
+    class Event(models.Base):
+
+        time = fields.TimeField()
+        date = fields.DateField()
+        moment = fields.DateTimeField()
+
+    event = Event()
+    assert event.time is None
+    assert event.date is None
+    assert event.moment is None
+    assert {} == event.to_struct()
+
+
+def test_date_fields_cache_parsed_values():
+
+    field = fields.DateTimeField(cache=2)
+    assert 2 == field.cache.maxsize
+
+    first = field.parse_value('2014-04-21T12:45:56')
+    assert first is field.parse_value('2014-04-21T12:45:56')
+    assert (1, 1) == (field.cache.hits, field.cache.misses)
+
+    field.parse_value('2014-04-22T12:45:56')
+    field.parse_value('2014-04-23T12:45:56')
+    assert 2 == len(field.cache)
+    assert first is not field.parse_value('2014-04-21T12:45:56')
+
+    assert fields.DateTimeField().cache is None
+
+
+def test_date_fields_share_cache():
+
+    cache = utilities.LRUCache()
+
+    class Event(models.Base):
+
+        date = fields.DateField(cache=cache)
+        moment = fields.DateTimeField(cache=cache)
+        start = fields.DateTimeField(cache=cache, strict=True)
+
+    event = Event(date='2014-04-21', moment='2014-04-21', start='2014-04-21')
+    assert datetime.date(2014, 4, 21) == event.date
+    assert datetime.datetime(2014, 4, 21) == event.moment
+    assert 3 == len(cache)
+
+    event = Event(date='2014-04-21', moment='April 21, 2014')
+    assert (1, 4) == (cache.hits, cache.misses)
+
+    with pytest.raises(errors.ValidationError):
+        event.start = 'April 21, 2014'
+    assert 4 == len(cache)
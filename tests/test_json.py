@@ -0,0 +1,289 @@
+import datetime
+import json
+
+import pytest
+import six
+
+from jsonmodels import models, fields, errors, parsers, collections
+
+
+class Wheel(models.Base):
+
+    size = fields.IntField(required=True)
+
+
+class Car(models.Base):
+
+    brand = fields.StringField(required=True)
+    registered = fields.DateField()
+    extras = fields.ListField(str)
+    spare = fields.EmbeddedField(Wheel)
+    wheels = fields.ListField(Wheel)
+    anything = fields.EmbeddedField(object)
+
+
+def _build_car():
+    return Car(
+        brand=u'Škoda',
+        registered=datetime.date(2014, 5, 7),
+        extras=['radio', 'sunroof'],
+        spare=Wheel(size=15),
+        wheels=[Wheel(size=16), Wheel(size=16)],
+        anything=[Wheel(size=17), {'a': [1, 2]}],
+    )
+
+
+_CAR_STRUCT = {
+    'brand': u'Škoda',
+    'registered': '2014-05-07',
+    'extras': ['radio', 'sunroof'],
+    'spare': {'size': 15},
+    'wheels': [{'size': 16}, {'size': 16}],
+    'anything': [{'size': 17}, {'a': [1, 2]}],
+}
+
+
+def test_to_json():
+
+    car = _build_car()
+    assert _CAR_STRUCT == json.loads(car.to_json())
+    assert _CAR_STRUCT == json.loads(parsers.to_json(car))
+
+    assert '{"brand": "Fiat", "extras": [], "wheels": []}' == (
+        Car(brand='Fiat').to_json())
+
+
+def test_to_json_with_encoder_options():
+
+    car = Car(brand=u'Škoda', extras=['radio'])
+
+    assert u'{"brand":"Škoda","extras":["radio"],"wheels":[]}' == (
+        car.to_json(ensure_ascii=False, separators=(',', ':')))
+
+    with pytest.raises(ValueError):
+        car.to_json(indent=2)
+
+
+def test_dump():
+
+    car = _build_car()
+    stream = six.StringIO()
+    car.dump(stream)
+    assert car.to_json() == stream.getvalue()
+    assert _CAR_STRUCT == json.loads(stream.getvalue())
+
+
+def test_to_json_validates_models():
+
+    with pytest.raises(errors.ValidationError):
+        Car().to_json()
+
+    car = _build_car()
+    car.wheels.append(Wheel())
+    with pytest.raises(errors.ValidationError):
+        car.to_json()
+    with pytest.raises(errors.ValidationError):
+        car.dump(six.StringIO())
+
+
+def test_to_json_validates_each_model_once():
+
+    validated = []
+
+    class Node(models.Base):
+
+        name = fields.StringField(required=True, validators=validated.append)
+
+    Node.child = fields.EmbeddedField(Node)
+    Node.children = fields.ListField(Node)
+
+    root = Node(name='root')
+    parent = root
+    for depth in range(5):
+        parent.child = Node(name='child{}'.format(depth))
+        parent.children.append(Node(name='item{}'.format(depth)))
+        parent = parent.child
+
+    del validated[:]
+    fields.forget_validations()
+    root.to_json()
+    assert 11 == len(validated)
+    assert 11 == len(set(validated))
+
+
+def test_to_json_encodes_values_as_json_module():
+
+    class Values(models.Base):
+
+        number = fields.IntField()
+        fraction = fields.FloatField()
+        flag = fields.BoolField()
+        text = fields.StringField()
+        anything = fields.EmbeddedField(object)
+
+    samples = [
+        dict(number=42, fraction=0.1, flag=True, text='a"b\n'),
+        dict(number=-10 ** 20, fraction=1e300, flag=False, text=u'zażółć'),
+        dict(fraction=float('inf'), anything=[None, 1.5, [True]]),
+        dict(fraction=float('-inf'), anything=(1, 'a')),
+        dict(fraction=7, anything=1),
+    ]
+    for sample in samples:
+        expected = dict(
+            (name, value) for name, value in sample.items()
+            if value is not None)
+        assert json.dumps(expected, sort_keys=True) == json.dumps(
+            json.loads(Values(**sample).to_json()), sort_keys=True)
+
+    assert '{"fraction": NaN}' == Values(fraction=float('nan')).to_json()
+    # `long` in Python 2.
+    assert '{"anything": 5}' == Values(
+        anything=six.integer_types[-1](5)).to_json()
+
+
+def test_from_json():
+
+    text = _build_car().to_json()
+    car = Car.from_json(text)
+
+    assert isinstance(car, Car)
+    assert isinstance(car.spare, Wheel)
+    assert isinstance(car.wheels, collections.ModelCollection)
+    assert [16, 16] == [wheel.size for wheel in car.wheels]
+    assert datetime.date(2014, 5, 7) == car.registered
+    assert text == car.to_json()
+    assert text == Car.from_json(text.encode('utf-8')).to_json()
+
+    with pytest.raises(errors.ValidationError):
+        Car.from_json('[]')
+    with pytest.raises(ValueError):
+        Car.from_json('{')
+
+
+def test_from_struct_is_the_same_as_init():
+
+    class Node(models.Base):
+
+        name = fields.StringField(required=True)
+
+    Node.child = fields.EmbeddedField(Node)
+    Node.children = fields.ListField(Node)
+    Node.tags = fields.ListField(str)
+
+    samples = [
+        {'name': 'root', 'unknown': 1},
+        {'name': 'root', 'child': {'name': 'child', 'child': {'name': 'x'}}},
+        {'name': 'root', 'children': [{'name': 'a'}, Node(name='b')]},
+        {'name': 'root', 'children': [], 'tags': ['a']},
+        {'name': 'root', 'child': Node(name='child'), 'children': None},
+    ]
+    for sample in samples:
+        assert Node(**sample).to_json() == Node.from_struct(sample).to_json()
+
+    # Items of lists are not validated as a whole, when assigned.
+    assert 1 == len(Node.from_struct({'children': [{}]}).children)
+
+    invalid_samples = [
+        {'name': 42},
+        {'child': {'name': 'child', 'child': {}}},
+        {'child': 'child'},
+        {'children': 'children'},
+        {'children': [{'name': 'a'}, 'b']},
+        {'children': [{'name': 'a', 'child': {}}]},
+        {'tags': ['a', 42]},
+    ]
+    for sample in invalid_samples:
+        with pytest.raises(errors.ValidationError):
+            Node(**sample)
+        with pytest.raises(errors.ValidationError):
+            Node.from_struct(sample)
+
+
+def test_from_struct_with_custom_models():
+
+    class Wheel(models.Base):
+
+        size = fields.IntField()
+
+        def __init__(self, **kwargs):
+            super(Wheel, self).__init__(**kwargs)
+            self.size = self.size or 15
+
+    class Truck(Car):
+
+        capacity = fields.FloatField()
+
+    class Slotted(models.Base):
+
+        name = fields.StringField()
+        wheel = fields.EmbeddedField(Wheel)
+        wheels = fields.ListField(Wheel)
+        vehicle = fields.EmbeddedField([Car, Truck])
+
+        class Meta:
+            slots = True
+
+    slotted = Slotted.from_struct({
+        'name': 'slotted',
+        'wheel': {},
+        'wheels': [{'size': 17}, {}],
+        'vehicle': Truck(brand='Volvo', capacity=2.5),
+    })
+    assert 'slotted' == slotted.name
+    assert 15 == slotted.wheel.size
+    assert [17, 15] == [wheel.size for wheel in slotted.wheels]
+    assert 2.5 == slotted.vehicle.capacity
+
+    with pytest.raises(errors.ValidationError):
+        Slotted.from_struct({'vehicle': {'brand': 'Volvo'}})
+
+
+def test_from_struct_after_fields_change():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    assert {'name': 'Alan'} == Person.from_struct({'name': 'Alan'}).to_struct()
+
+    Person.surname = fields.StringField()
+    person = Person.from_struct({'name': 'Alan', 'surname': 'Wake'})
+    assert {'name': 'Alan', 'surname': 'Wake'} == person.to_struct()
+
+
+def test_construct():
+
+    car = Car.from_trusted_struct(_CAR_STRUCT)
+    assert _build_car().to_struct() == car.to_struct()
+    assert isinstance(car.spare, Wheel)
+    assert isinstance(car.wheels, collections.ModelCollection)
+    assert [16, 16] == [wheel.size for wheel in car.wheels]
+    assert datetime.date(2014, 5, 7) == car.registered
+
+    car = Car.construct(brand='Fiat', wheels=[Wheel(size=15), {'size': 16}])
+    assert 'Fiat' == car.brand
+    assert [15, 16] == [wheel.size for wheel in car.wheels]
+    assert [] == car.extras
+
+
+def test_construct_skips_validation():
+
+    car = Car.from_trusted_struct({
+        'brand': 42,
+        'spare': {'size': 'big'},
+        'wheels': [{}],
+    })
+    assert 42 == car.brand
+    assert 'big' == car.spare.size
+
+    with pytest.raises(errors.ValidationError):
+        car.validate()
+    with pytest.raises(errors.ValidationError):
+        car.wheels[0].validate()
+    with pytest.raises(errors.ValidationError):
+        car.spare.validate()
+
+    car.brand = 'Fiat'
+    assert 'Fiat' == car.brand
+    with pytest.raises(errors.ValidationError):
+        car.brand = 42
@@ -0,0 +1,111 @@
+import datetime
+import io
+import os
+import pickle
+
+import pytest
+
+from jsonmodels import models, fields, errors, jsonl
+
+
+class Item(models.Base):
+
+    name = fields.StringField(required=True)
+
+
+class Order(models.Base):
+
+    number = fields.IntField(required=True)
+    date = fields.DateField()
+    items = fields.ListField(Item)
+
+
+def _build_orders(amount):
+    return [
+        Order(
+            number=number,
+            date=datetime.date(2014, 5, 7),
+            items=[Item(name='item{}'.format(number))])
+        for number in range(amount)]
+
+
+def test_models_can_be_pickled():
+
+    order = _build_orders(1)[0]
+    order.validate()
+    copied = pickle.loads(pickle.dumps(order))
+
+    assert order.to_struct() == copied.to_struct()
+    assert copied.items.field is Order.items
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_dump_and_load_jsonl(tmpdir, workers):
+
+    path = str(tmpdir.join('orders.jsonl'))
+    orders = _build_orders(50)
+    dump_stats = {}
+    Order.dump_jsonl(
+        iter(orders), path, workers=workers, chunk_size=7, stats=dump_stats)
+
+    with io.open(path, encoding='utf-8') as stream:
+        lines = stream.read().splitlines()
+    assert [order.to_json() for order in orders] == lines
+
+    load_stats = {}
+    loaded = list(Order.load_jsonl(
+        path, workers=workers, chunk_size=7, stats=load_stats))
+    assert [order.to_json() for order in orders] == [
+        order.to_json() for order in loaded]
+    assert datetime.date(2014, 5, 7) == loaded[0].date
+
+    for stats in (dump_stats, load_stats):
+        assert 50 == sum(worker.records for worker in stats.values())
+        assert all(worker.throughput > 0 for worker in stats.values())
+    if workers == 0:
+        assert [os.getpid()] == list(load_stats)
+
+
+def test_load_jsonl_unordered(tmpdir):
+
+    path = str(tmpdir.join('orders.jsonl'))
+    jsonl.dump(_build_orders(50), path, workers=2, ordered=False, chunk_size=3)
+    loaded = list(jsonl.load(
+        Order, path, workers=2, ordered=False, chunk_size=3))
+
+    assert list(range(50)) == sorted(order.number for order in loaded)
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_load_jsonl_with_invalid_records(tmpdir, workers):
+
+    path = tmpdir.join('orders.jsonl')
+    path.write_binary(
+        b'{"number": 1}\n'
+        b'\n'
+        b'{"number": "2"}\n'
+        b'{"number": 3, "items": [42]}\n'
+        b'[4]\n'
+        b'{"number": 5}\n')
+
+    with pytest.raises(errors.ItemValidationError) as info:
+        list(Order.load_jsonl(str(path), workers=workers))
+    assert 15 == info.value.offset
+
+    invalid = []
+    loaded = list(Order.load_jsonl(
+        str(path), workers=workers, on_error=invalid.append, chunk_size=2))
+    assert [1, 5] == [order.number for order in loaded]
+    assert [15, 31, 60] == [error.offset for error in invalid]
+
+    path.write_binary(b'{"number": 1}\n{"number": \n')
+    with pytest.raises(ValueError) as info:
+        list(Order.load_jsonl(str(path), workers=workers))
+    assert 'offset 14' in str(info.value)
+
+
+def test_dump_jsonl_with_invalid_models(tmpdir):
+
+    path = str(tmpdir.join('orders.jsonl'))
+    with pytest.raises(errors.ValidationError):
+        Order.dump_jsonl([Order(number=1), Order()], path, workers=2)
@@ -1,6 +1,8 @@
+import json
+
 import pytest
 
-from jsonmodels import models, fields, errors
+from jsonmodels import models, fields, errors, parsers
 
 
 def test_model1():
@@ -325,6 +327,35 @@ def test_get_field():
     assert alan.get_field('name') is name_field
     assert alan.get_field('surname') is surname_field
     assert alan.get_field('age') is age_field
+    assert Person.get_field('name') is name_field
+
+    with pytest.raises(errors.FieldNotFound):
+        alan.get_field('nickname')
+
+
+def test_get_fields():
+
+    name_field = fields.StringField()
+    age_field = fields.IntField()
+
+    class Person(models.Base):
+
+        name = name_field
+        age = age_field
+
+    assert [age_field, name_field] == Person.get_fields('age', 'name')
+    assert [] == Person.get_fields()
+
+    with pytest.raises(errors.FieldNotFound):
+        Person.get_fields('name', 'nickname')
+
+    class Employee(Person):
+
+        age = None
+
+    assert [name_field] == Employee.get_fields('name')
+    with pytest.raises(errors.FieldNotFound):
+        Employee.get_field('age')
 
 
 def test_repr():
@@ -468,3 +499,260 @@ def test_assignation_of_list_of_models():
     viper = Car()
     viper.wheels = None
     viper.wheels = [Wheel()]
+
+
+def test_values_are_stored_in_instance():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        age = fields.IntField()
+
+    alan = Person(name='Alan')
+    chuck = Person(name='Chuck', age=42)
+
+    assert {'name': 'Alan'} == vars(alan)
+    assert {'name': 'Chuck', 'age': 42} == vars(chuck)
+
+    assert alan.age is None
+    assert {'name': 'Alan', 'age': None} == vars(alan)
+
+
+def test_field_shared_between_models():
+
+    field = fields.StringField()
+
+    class Person(models.Base):
+
+        name = field
+
+    class Pet(models.Base):
+
+        nick = field
+        name = fields.StringField()
+
+    person = Person(name='Alan')
+    pet = Pet(nick='Garfield', name='Cat')
+
+    assert person.get_field('name') is field
+    assert pet.get_field('nick') is not field
+    assert 'Alan' == person.name
+    assert 'Garfield' == pet.nick
+    assert 'Cat' == pet.name
+
+
+def test_field_assigned_after_class_creation():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    Person.surname = fields.StringField()
+
+    person = Person(name='Alan', surname='Wake')
+    assert 'Alan' == person.name
+    assert 'Wake' == person.surname
+
+
+def test_fields_are_iterated_in_order_of_declaration():
+
+    class Person(models.Base):
+
+        surname = fields.StringField()
+        name = fields.StringField()
+        age = fields.IntField()
+
+    assert ['surname', 'name', 'age'] == [
+        name for name, _ in Person.iterate_over_fields()]
+    assert ['surname', 'name', 'age'] == [name for name, _ in Person()]
+
+
+def test_fields_registry_with_inheritance():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        surname = fields.StringField()
+
+    class Employee(Person):
+
+        salary = fields.FloatField()
+        surname = None
+
+    assert ['name', 'salary'] == [
+        name for name, _ in Employee.iterate_over_fields()]
+
+    Person.age = fields.IntField()
+    assert ['name', 'surname', 'age'] == [
+        name for name, _ in Person.iterate_over_fields()]
+    assert ['name', 'salary', 'age'] == [
+        name for name, _ in Employee.iterate_over_fields()]
+
+    del Person.name
+    assert ['salary', 'age'] == [
+        name for name, _ in Employee.iterate_over_fields()]
+
+
+def test_model_with_slots():
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+
+        class Meta:
+            slots = True
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        age = fields.IntField()
+        car = fields.EmbeddedField(Car)
+        pets = fields.ListField(str)
+
+        class Meta:
+            slots = True
+            compile_populate = True
+
+    class Employee(Person):
+
+        salary = fields.FloatField()
+
+    person = Employee(name='Alan', car={'brand': 'Fiat'}, salary=2.5)
+    assert not hasattr(person, '__dict__')
+    assert 'Alan' == person.name
+    assert person.age is None
+    assert 'Fiat' == person.car.brand
+    assert 2.5 == person.salary
+
+    person.pets.append('Garfield')
+    person.age = 42
+    with pytest.raises(errors.ValidationError):
+        person.age = '42'
+
+    pattern = {
+        'name': 'Alan',
+        'age': 42,
+        'car': {'brand': 'Fiat'},
+        'pets': ['Garfield'],
+        'salary': 2.5,
+    }
+    assert pattern == person.to_struct()
+
+    with pytest.raises(AttributeError):
+        person.nickname = 'Wake'
+
+    with pytest.raises(TypeError):
+        Person.nickname = fields.StringField()
+
+
+def test_field_shared_between_models_with_slots():
+
+    field = fields.StringField()
+
+    class Person(models.Base):
+
+        name = field
+
+        class Meta:
+            slots = True
+
+    class Pet(models.Base):
+
+        name = field
+
+    person = Person(name='Alan')
+    pet = Pet(name='Garfield')
+    assert 'Alan' == person.name
+    assert 'Garfield' == pet.name
+
+
+def test_embedded_field_with_discriminator():
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+
+    class Bike(models.Base):
+
+        kind = fields.StringField()
+        gears = fields.IntField()
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        vehicle = fields.EmbeddedField(
+            {'car': Car, 'bike': Bike}, discriminator='kind')
+
+    for create in [
+            lambda data: Person(**data),
+            Person.from_struct,
+            Person.from_trusted_struct]:
+        person = create({'vehicle': {'kind': 'car', 'brand': 'Fiat'}})
+        assert isinstance(person.vehicle, Car)
+        assert 'Fiat' == person.vehicle.brand
+
+        person = create({'vehicle': {'kind': 'bike', 'gears': 3}})
+        assert isinstance(person.vehicle, Bike)
+        assert 3 == person.vehicle.gears
+
+        with pytest.raises(errors.ValidationError) as info:
+            create({'vehicle': {'kind': 'boat'}})
+        assert 'unknown_discriminator' == info.value.code
+        assert (
+            'Cannot decide which type to choose for "kind" equal to "boat".'
+            == str(info.value))
+        with pytest.raises(errors.ValidationError):
+            create({'vehicle': {'brand': 'Fiat'}})
+
+    with pytest.raises(errors.ValidationError):
+        Person.from_struct({'vehicle': {'kind': 'car'}})
+
+    person = Person(name='Alan', vehicle=Car(brand='Fiat'))
+    pattern = {'name': 'Alan', 'vehicle': {'kind': 'car', 'brand': 'Fiat'}}
+    assert pattern == person.to_struct()
+    assert pattern == parsers.to_struct(person)
+    assert pattern == json.loads(person.to_json())
+    assert pattern == Person.from_json(person.to_json()).to_struct()
+
+    class SportsCar(Car):
+
+        top_speed = fields.IntField()
+
+    person.vehicle = SportsCar(brand='Ferrari', top_speed=300)
+    assert {'kind': 'car', 'brand': 'Ferrari', 'top_speed': 300} == (
+        person.to_struct()['vehicle'])
+    assert 'car' == json.loads(person.to_json())['vehicle']['kind']
+    loaded = Person.from_struct(person.to_struct())
+    assert isinstance(loaded.vehicle, Car)
+    assert 'Ferrari' == loaded.vehicle.brand
+
+    person.vehicle = Bike(kind='mountain')
+    assert {'kind': 'mountain'} == json.loads(person.to_json())['vehicle']
+
+    with pytest.raises(ValueError):
+        fields.EmbeddedField({'car': Car})
+    with pytest.raises(ValueError):
+        fields.EmbeddedField([Car, Bike], discriminator='kind')
+
+
+def test_fields_declared_in_mixin():
+
+    class Named(object):
+
+        name = fields.StringField()
+        surname = fields.StringField()
+
+    class Person(Named, models.Base):
+
+        age = fields.IntField()
+
+    class Pet(Named, models.Base):
+
+        pass
+
+    person = Person(name='Alan', surname='Wake', age=42)
+    assert 'Alan' == person.name
+    assert 'Wake' == person.surname
+    assert {'name': 'Alan', 'surname': 'Wake', 'age': 42} == person.to_struct()
+    assert {'name': 'Garfield'} == Pet(name='Garfield').to_struct()
+    assert Named.name.name is None
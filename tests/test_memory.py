@@ -0,0 +1,67 @@
+import gc
+import sys
+import weakref
+
+import pytest
+
+from jsonmodels import models, fields
+
+import tests
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class Car(models.Base):
+
+    brand = fields.StringField(required=True)
+
+
+class Person(models.Base):
+
+    name = fields.StringField()
+    age = fields.IntField()
+    car = fields.EmbeddedField(Car)
+    tags = fields.ListField(str)
+
+
+def _build_person(index):
+    return Person(
+        name='Alan', age=index, car={'brand': 'Fiat'}, tags=['a', 'b'])
+
+
+def _max_rss_in_kilobytes():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return max_rss / 1024
+    return max_rss
+
+
+def test_models_are_released():
+
+    references = []
+    for index in range(1000):
+        person = _build_person(index)
+        person.to_struct()
+        references.append(weakref.ref(person))
+        references.append(weakref.ref(person.car))
+    del person
+
+    gc.collect()
+    assert all(reference() is None for reference in references)
+
+
+@pytest.mark.skipif(
+    tests.QUICK_TESTS or resource is None, reason="Quick tests.")
+def test_memory_usage_is_bounded():
+
+    gc.collect()
+    before = _max_rss_in_kilobytes()
+
+    for index in range(1000000):
+        _build_person(index)
+
+    gc.collect()
+    assert _max_rss_in_kilobytes() - before < 20 * 1024
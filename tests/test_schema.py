@@ -1,3 +1,5 @@
+import pytest
+
 from jsonmodels import models, fields, validators
 from jsonmodels.utilities import compare_schemas
 
@@ -285,6 +287,29 @@ def test_regex_validator_with_flag():
     assert compare_schemas(pattern, schema)
 
 
+def test_regex_validator_with_full_match():
+
+    class Person(models.Base):
+
+        name = fields.StringField(
+            validators=validators.Regex('some|pattern', full_match=True))
+
+    schema = Person.to_json_schema()
+
+    pattern = get_fixture('schema_pattern_full_match.json')
+    assert compare_schemas(pattern, schema)
+
+
+def test_regex_validator_with_full_match_and_multiline():
+
+    # Anchors of pattern in schema would match at lines, unlike validator.
+    with pytest.raises(ValueError):
+        validators.Regex('some|pattern', full_match=True, multiline=True)
+    with pytest.raises(ValueError):
+        validators.Regex(
+            '/some|pattern/m', full_match=True, multiline=False)
+
+
 def test_length_validator_min():
 
     class Person(models.Base):
@@ -311,3 +336,26 @@ def test_length_validator():
 
     pattern = get_fixture('schema_length.json')
     assert compare_schemas(pattern, schema)
+
+
+def test_embedded_field_with_discriminator():
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+
+    class Bike(models.Base):
+
+        kind = fields.StringField()
+        gears = fields.IntField()
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        vehicle = fields.EmbeddedField(
+            {'car': Car, 'auto': Car, 'bike': Bike}, discriminator='kind')
+
+    schema = Person.to_json_schema()
+
+    pattern = get_fixture('schema_discriminator.json')
+    assert compare_schemas(pattern, schema)
@@ -0,0 +1,118 @@
+import io
+
+import pytest
+
+from jsonmodels import models, fields, errors, streams
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    age = fields.IntField()
+
+
+class _CountingStream(io.BytesIO):
+
+    def __init__(self, *args):
+        super(_CountingStream, self).__init__(*args)
+        self.read_amount = 0
+
+    def read(self, size=-1):
+        data = super(_CountingStream, self).read(size)
+        self.read_amount += len(data)
+        return data
+
+
+def test_iter_array():
+
+    text = u' [ 1 , 2.5,{"a": [1, "ż"]} , null,\n"x", true ] \n'
+    expected = [1, 2.5, {'a': [1, u'ż']}, None, 'x', True]
+
+    for chunk_size in (1, 2, 3, 1000):
+        items = list(streams.iter_array(io.StringIO(text), chunk_size))
+        assert expected == [item for _, item in items]
+        assert [3, 7, 11, 29, 35, 40] == [offset for offset, _ in items]
+
+        items = list(streams.iter_array(
+            io.BytesIO(text.encode('utf-8')), chunk_size))
+        assert expected == [item for _, item in items]
+        assert [3, 7, 11, 30, 36, 41] == [offset for offset, _ in items]
+
+    assert [] == list(streams.iter_array(io.StringIO(u'[]')))
+    assert [] == list(streams.iter_array(io.StringIO(u' [\n] ')))
+
+
+def test_iter_array_with_invalid_json():
+
+    for text in [u'', u'{}', u'[', u'[1', u'[1,]', u'[1 2]', u'[2.x]',
+                 u'[1] x', u'[{"a": 1]']:
+        with pytest.raises(ValueError):
+            list(streams.iter_array(io.StringIO(text), 2))
+
+    with pytest.raises(ValueError) as info:
+        list(streams.iter_array(io.StringIO(u'[1, 2, x]')))
+    assert 'offset 7' in str(info.value)
+
+
+def test_iter_array_reads_stream_incrementally():
+
+    item = b'{"name": "Alan", "tags": ["a", "b", "c"]}'
+    stream = _CountingStream(b'[' + b', '.join([item] * 10000) + b']')
+
+    items = streams.iter_array(stream, 100)
+    next(items)
+    assert stream.read_amount <= 200
+
+    assert 9999 == len(list(items))
+
+    big_item = b'{"text": "' + b'a' * 100000 + b'"}'
+    stream = _CountingStream(b'[' + big_item + b', 1]')
+    assert 2 == len(list(streams.iter_array(stream, 10)))
+
+
+def test_iter_array_fails_without_reading_rest_of_stream():
+
+    items = b', '.join([b'{"a": 1}'] * 100000)
+    stream = _CountingStream(b'[{"a": 1}, {"a": tru}, ' + items + b']')
+
+    with pytest.raises(ValueError) as info:
+        list(streams.iter_array(stream, 1024))
+    assert 'offset 11' in str(info.value)
+    assert stream.read_amount <= 2048
+
+    # Tokens split between chunks are still read.
+    text = u'[{"a": -Infinity, "b": "\\u017c", "c": [true, 1.5e3]}]'
+    for chunk_size in (1, 2, 3, 5, 7):
+        assert [{'a': float('-inf'), 'b': u'\u017c', 'c': [True, 1500.0]}] == [
+            item for _, item in streams.iter_array(
+                io.StringIO(text), chunk_size)]
+
+
+def test_iter_from_file():
+
+    stream = io.BytesIO(
+        b'[{"name": "Alan", "age": 24}, {"name": "Bob"}, {"name": "Eve"}]')
+    people = list(Person.iter_from_file(stream))
+
+    assert 3 == len(people)
+    assert all(isinstance(person, Person) for person in people)
+    assert ['Alan', 'Bob', 'Eve'] == [person.name for person in people]
+    assert 24 == people[0].age
+
+
+def test_iter_from_file_with_invalid_items():
+
+    text = b'[{"name": "Alan"}, {"age": 24}, {"name": 1}, 42, {"name": "Eve"}]'
+
+    people = Person.iter_from_file(io.BytesIO(text))
+    assert 'Alan' == next(people).name
+    with pytest.raises(errors.ItemValidationError) as info:
+        next(people)
+    assert 19 == info.value.offset
+    assert 'offset 19' in str(info.value)
+    assert isinstance(info.value.error, errors.ValidationError)
+
+    invalid = []
+    people = list(Person.iter_from_file(io.BytesIO(text), invalid.append))
+    assert ['Alan', 'Eve'] == [person.name for person in people]
+    assert [19, 32, 45] == [error.offset for error in invalid]
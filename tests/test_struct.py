@@ -2,7 +2,7 @@ from datetime import datetime
 
 import pytest
 
-from jsonmodels import models, fields, errors
+from jsonmodels import models, fields, errors, parsers, compilers
 
 
 class _DateField(fields.BaseField):
@@ -155,3 +155,118 @@ def test_to_struct_with_multi_non_models_types():
     person.mix.append('different')
     pattern['mix'].append('different')
     assert pattern == person.to_struct()
+
+
+def _build_parking():
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+        extras = fields.ListField(str)
+
+    class Truck(Car):
+
+        capacity = fields.FloatField()
+
+    class Parking(models.Base):
+
+        location = fields.StringField()
+        built = fields.DateField()
+        owner = fields.EmbeddedField(Car)
+        cars = fields.ListField(Car)
+        mix = fields.ListField()
+        anything = fields.EmbeddedField(object)
+
+    parking = Parking(
+        location='somewhere',
+        built=datetime(2014, 5, 7).date(),
+        owner=Car(brand='Fiat'),
+        cars=[
+            Car(brand='Fiat', extras=['radio', 'sunroof']),
+            Truck(brand='Volvo', capacity=22.5),
+        ],
+        anything=Car(brand='Skoda'),
+    )
+    parking.mix.append(Car(brand='Lada'))
+    parking.mix.append('text')
+    parking.mix.append(42)
+    return parking
+
+
+def test_compiled_to_struct():
+
+    parking = _build_parking()
+    pattern = {
+        'location': 'somewhere',
+        'built': datetime(2014, 5, 7).date(),
+        'owner': {'brand': 'Fiat', 'extras': []},
+        'cars': [
+            {'brand': 'Fiat', 'extras': ['radio', 'sunroof']},
+            {'brand': 'Volvo', 'extras': [], 'capacity': 22.5},
+        ],
+        'mix': [{'brand': 'Lada', 'extras': []}, 'text', 42],
+        'anything': {'brand': 'Skoda', 'extras': []},
+    }
+
+    assert pattern == parsers.to_struct(parking)
+    assert pattern == parking.to_struct()
+    assert parking.__class__._compiled_to_struct is not None
+
+    parking.cars.append(type(parking.owner)())
+    with pytest.raises(errors.ValidationError):
+        parking.to_struct()
+
+
+def test_compiled_to_struct_can_be_turned_off(monkeypatch):
+
+    parking = _build_parking()
+    monkeypatch.setattr(compilers, 'USE_COMPILED_SERIALIZERS', False)
+
+    assert 'somewhere' == parking.to_struct()['location']
+    assert parking.__class__._compiled_to_struct is None
+
+
+def test_compiled_to_struct_after_fields_change():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    person = Person(name='Alan')
+    assert {'name': 'Alan'} == person.to_struct()
+
+    Person.surname = fields.StringField()
+    person.surname = 'Wake'
+    assert {'name': 'Alan', 'surname': 'Wake'} == person.to_struct()
+
+
+def test_to_struct_validates_each_model_once():
+
+    validated = []
+
+    class Node(models.Base):
+
+        name = fields.StringField(required=True, validators=validated.append)
+
+    Node.child = fields.EmbeddedField(Node)
+    Node.children = fields.ListField(Node)
+
+    root = Node(name='root')
+    parent = root
+    for depth in range(5):
+        parent.child = Node(name='child{}'.format(depth))
+        parent.children.append(Node(name='item{}'.format(depth)))
+        parent = parent.child
+
+    for casting in [parsers.to_struct, lambda model: model.to_struct()]:
+        del validated[:]
+        fields.forget_validations()
+        casting(root)
+        assert 11 == len(validated)
+        assert 11 == len(set(validated))
+
+    root.validate()
+    parent.children.append(Node())
+    for casting in [parsers.to_struct, lambda model: model.to_struct()]:
+        with pytest.raises(errors.ValidationError):
+            casting(root)
@@ -178,3 +178,30 @@ def test_converters():
 
     assert '^some \w python regex$' == result.regex
     assert [re.I] == result.flags
+
+
+def test_lru_cache():
+
+    cache = utilities.LRUCache(2)
+    assert 0 == len(cache)
+    assert cache.get('a') is None
+    assert 42 == cache.get('a', 42)
+    assert (0, 2) == (cache.hits, cache.misses)
+
+    cache['a'] = 1
+    cache['b'] = 2
+    assert 1 == cache.get('a')
+    cache['c'] = 3
+
+    assert 2 == len(cache)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert (1, 2) == (cache.hits, cache.misses)
+
+    cache.clear()
+    assert 0 == len(cache)
+    assert (0, 0) == (cache.hits, cache.misses)
+
+    with pytest.raises(ValueError):
+        utilities.LRUCache(0)
@@ -1,5 +1,7 @@
 """Test for validators."""
 
+import pickle
+
 import pytest
 
 from jsonmodels import models, fields, validators, errors
@@ -64,6 +66,27 @@ def test_validators_are_always_iterable():
     assert isinstance(alan.get_field('children').validators, list)
 
 
+def test_changed_validators_are_used():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    Person(name='Al').validate()
+
+    Person.name.validators.append(validators.Length(3, 10))
+    with pytest.raises(errors.ValidationError):
+        Person(name='Al')
+    person = Person(name='Alan')
+
+    Person.name.validators[0] = validators.Length(5, 10)
+    with pytest.raises(errors.ValidationError):
+        person.validate()
+
+    del Person.name.validators[:]
+    Person(name='Al').validate()
+
+
 def test_min_validation():
 
     validator = validators.Min(3)
@@ -89,6 +112,44 @@ def test_value_validation():
         validator.validate('d')
 
 
+def test_value_validation_with_unhashable_values():
+
+    validator = validators.Value([1, 'a', [1, 2], {'a': 1}])
+
+    validator.validate(1)
+    validator.validate('a')
+    validator.validate([1, 2])
+    validator.validate({'a': 1})
+
+    with pytest.raises(errors.ValidationError):
+        validator.validate(2)
+    with pytest.raises(errors.ValidationError):
+        validator.validate([2, 1])
+    with pytest.raises(errors.ValidationError):
+        validator.validate({'a': 2})
+
+
+def test_value_validation_with_many_values():
+
+    allowed_values = ['code{}'.format(index) for index in range(20000)]
+    validator = validators.Value(allowed_values)
+
+    validator.validate('code0')
+    validator.validate('code19999')
+
+    with pytest.raises(errors.ValidationError) as info:
+        validator.validate('code20000')
+
+    message = str(info.value)
+    assert 'code9' in message
+    assert 'code10' not in message
+    assert '...' in message
+
+    schema = {}
+    validator.modify_schema(schema)
+    assert allowed_values == schema['allowedValues']
+
+
 def test_exclusive_validation():
 
     validator = validators.Min(3, True)
@@ -239,3 +300,424 @@ def test_length_validation():
         validator.validate('')
     with pytest.raises(errors.ValidationError):
         validator.validate('na' * 10)
+
+
+def test_validator_errors_are_not_masked():
+
+    class BrokenValidator(object):
+
+        def validate(self, value):
+            raise AttributeError('Some bug.')
+
+    class Person(models.Base):
+
+        name = fields.StringField(validators=BrokenValidator())
+
+    person = Person()
+    with pytest.raises(AttributeError):
+        person.name = 'Alan'
+
+
+def test_validation_follows_changes_of_field():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    person = Person()
+    person.name = None
+    person.validate()
+
+    field = person.get_field('name')
+    field.required = True
+    with pytest.raises(errors.ValidationError):
+        person.validate()
+
+    field.required = False
+    field.validators = [validators.Length(3, 10)]
+    with pytest.raises(errors.ValidationError):
+        person.name = 'Al'
+    person.name = 'Alan'
+
+    field.types = (int,)
+    with pytest.raises(errors.ValidationError):
+        person.name = 'Alan'
+
+
+def test_regex_validation_full_match():
+
+    validator = validators.Regex('some|other', full_match=True)
+    assert 'some|other' == validator.pattern
+
+    validator.validate('some')
+    validator.validate('other')
+    with pytest.raises(errors.ValidationError):
+        validator.validate('some string')
+    with pytest.raises(errors.ValidationError):
+        validator.validate('the other')
+    with pytest.raises(errors.ValidationError):
+        validator.validate('some\n')
+
+    validator = validators.Regex('^s.*e$', full_match=True, ignorecase=True)
+    validator.validate('SomE')
+    with pytest.raises(errors.ValidationError):
+        validator.validate('some\nso more')
+
+
+def test_regex_validation_of_non_strings():
+
+    validator = validators.Regex('^some$')
+    with pytest.raises(errors.ValidationError):
+        validator.validate(42)
+
+
+def test_validation_errors_name_fields():
+
+    class Wheel(models.Base):
+
+        size = fields.IntField(required=True)
+
+    class Car(models.Base):
+
+        brand = fields.StringField(required=True)
+        spare = fields.EmbeddedField(Wheel)
+
+    car = Car(brand='Fiat', spare=Wheel(size=15))
+    car.spare.get_field('size').required = False
+    car.spare.size = None
+    car.spare.get_field('size').required = True
+
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'spare' == info.value.field_name
+    assert 'size' == info.value.error.field_name
+    assert str(info.value).startswith(
+        'Error for field "spare": Error for field "size": ')
+
+
+def test_deferred_validation():
+
+    class Wheel(models.Base):
+
+        size = fields.IntField(required=True)
+
+    class Car(models.Base):
+
+        brand = fields.StringField(
+            required=True, validators=validators.Length(2, 10))
+        spare = fields.EmbeddedField(Wheel)
+        wheels = fields.ListField(Wheel)
+
+    with fields.deferred_validation():
+        assert fields.is_deferred_validation()
+        car = Car(brand=42, spare={})
+        car.brand = 'A'
+        car.wheels.append(Wheel(size=-1))
+        with pytest.raises(errors.ValidationError):
+            car.wheels.append('wheel')
+        loaded = Car.from_struct({'brand': 42, 'wheels': [{}]})
+    assert not fields.is_deferred_validation()
+
+    assert 'A' == car.brand
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'brand' == info.value.field_name
+    with pytest.raises(errors.ValidationError):
+        car.to_struct()
+    with pytest.raises(errors.ValidationError):
+        loaded.validate()
+
+    car.brand = 'Fiat'
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'spare' == info.value.field_name
+    car.spare.size = 15
+    car.validate()
+
+    with pytest.raises(errors.ValidationError):
+        car.brand = 42
+
+
+def test_deferred_validation_option():
+
+    for compile_populate in [False, True]:
+
+        class Person(models.Base):
+
+            name = fields.StringField(required=True)
+            age = fields.IntField(validators=validators.Min(0))
+
+            class Meta:
+                deferred_validation = True
+
+        Person.Meta.compile_populate = compile_populate
+        Person._refresh_fields()
+
+        person = Person(name=42, age=-1)
+        person.age = -2
+        assert -2 == person.age
+        with pytest.raises(errors.FieldValidationError):
+            person.validate()
+
+        person = Person.from_struct({'age': -3})
+        assert -3 == person.age
+        with pytest.raises(errors.FieldValidationError) as info:
+            person.to_struct()
+        assert 'name' == info.value.field_name
+
+        class Team(models.Base):
+
+            leader = fields.EmbeddedField(Person)
+
+        with pytest.raises(errors.ValidationError):
+            Team(leader={'age': -1})
+        with pytest.raises(errors.ValidationError):
+            Team.from_struct({'leader': {'age': -1}})
+
+
+def test_validation_of_changes_only():
+
+    validated = []
+
+    class Wheel(models.Base):
+
+        size = fields.IntField(validators=validated.append)
+
+    class Car(models.Base):
+
+        brand = fields.StringField(validators=validated.append)
+        model = fields.StringField(validators=validated.append)
+        spare = fields.EmbeddedField(Wheel)
+        wheels = fields.ListField(
+            Wheel, validators=validators.Length(0, 4))
+
+    car = Car(brand='Fiat', model='Panda', spare=Wheel(size=15))
+    car.wheels.append(Wheel(size=14))
+    car.validate()
+
+    del validated[:]
+    car.validate()
+    assert [] == validated
+
+    # Creating fields and models doesn't change rules of validation.
+    fields.StringField(required=True, validators=validated.append)
+
+    class Truck(Car):
+
+        load = fields.IntField(required=True)
+
+    car.validate()
+    assert [] == validated
+
+    car.model = 'Uno'
+    car.spare.size = 16
+    car.populate(brand='Opel')
+    car.validate()
+    assert ['Uno', 16, 'Opel'] == validated
+
+    del validated[:]
+    with fields.deferred_validation():
+        car.model = 'Punto'
+        car.spare.size = 17
+    car.validate()
+    assert ['Punto', 17] == validated
+
+    car.wheels.extend([Wheel(), Wheel(), Wheel()])
+    car.validate()
+    car.wheels.insert(0, Wheel())
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'wheels' == info.value.field_name
+    car.wheels.pop()
+    car.validate()
+
+    del validated[:]
+    car.get_field('model').validators = [validators.Length(6, 10)]
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'model' == info.value.field_name
+    assert ['Opel'] == validated
+
+
+def test_validation_of_changes_runs_validators_of_parent_fields():
+
+    def small_wheel(wheel):
+        if wheel.size > 20:
+            raise errors.ValidationError('Wheel is too big.')
+
+    def cheap(items):
+        if sum(item.price for item in items) > 100:
+            raise errors.ValidationError('Items are too expensive.')
+
+    class Wheel(models.Base):
+
+        size = fields.IntField()
+
+    class Item(models.Base):
+
+        price = fields.IntField()
+
+    class Car(models.Base):
+
+        spare = fields.EmbeddedField(Wheel, validators=[small_wheel])
+        items = fields.ListField(Item, validators=[cheap])
+
+    car = Car(spare=Wheel(size=15), items=[Item(price=30), Item(price=40)])
+    car.validate()
+
+    car.spare.size = 99
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'spare' == info.value.field_name
+    with pytest.raises(errors.FieldValidationError):
+        car.to_struct()
+
+    car.spare.size = 16
+    car.validate()
+
+    car.items[0].price = 70
+    with pytest.raises(errors.FieldValidationError) as info:
+        car.validate()
+    assert 'items' == info.value.field_name
+    with pytest.raises(errors.FieldValidationError):
+        car.to_struct()
+
+
+def test_validation_of_changes_with_deferred_validation():
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True)
+        age = fields.IntField(validators=validators.Min(0))
+
+        class Meta:
+            slots = True
+            compile_populate = True
+
+    person = Person(name='Alan', age=1)
+    person.validate()
+
+    with fields.deferred_validation():
+        person.populate(age=-1)
+    with pytest.raises(errors.FieldValidationError) as info:
+        person.validate()
+    assert 'age' == info.value.field_name
+
+    person.age = 2
+    person.validate()
+
+    record = pickle.loads(pickle.dumps(person._validation_record))
+    assert person._validation_record.is_current()
+    assert not record.is_current()
+
+
+def test_collecting_validation_errors():
+
+    class Item(models.Base):
+
+        name = fields.StringField(required=True)
+        price = fields.FloatField(validators=validators.Min(0))
+
+    class Order(models.Base):
+
+        number = fields.IntField(required=True)
+        items = fields.ListField(Item, validators=validators.Length(0, 3))
+        gift = fields.EmbeddedField(Item)
+
+    class Customer(models.Base):
+
+        name = fields.StringField(required=True)
+        orders = fields.ListField(Order)
+
+    data = {
+        'name': 'Alan',
+        'orders': [
+            {'number': 1, 'items': [{'name': 'pen', 'price': 1.5}]},
+            {'items': [{'name': 'pen', 'price': -1}, {'price': 2}],
+             'gift': {'price': 1}},
+        ],
+    }
+    with fields.deferred_validation():
+        customer = Customer(**data)
+
+    found = customer.validate(collect=True)
+    assert all(isinstance(error, errors.FieldValidationError)
+               for error in found)
+    assert [
+        'orders[1].number',
+        'orders[1].items[0].price',
+        'orders[1].items[1].name',
+        'orders[1].gift.name',
+    ] == [error.field_name for error in found]
+    assert 'Field is required!' == str(found[0].error)
+
+    assert 2 == len(customer.validate(collect=True, max_errors=2))
+
+    customer.orders[0].items.extend([Order()])
+    assert ['orders[0].items[1]'] == [
+        error.field_name
+        for error in customer.validate(collect=True)][:1]
+
+    with pytest.raises(errors.AggregatedValidationError) as info:
+        Customer.from_struct(data, collect=True)
+    assert 4 == len(info.value.errors)
+    assert str(info.value).startswith(
+        'Found 4 validation errors: Error for field "orders[1].number": ')
+
+    data['orders'].pop()
+    customer = Customer.from_struct(data, collect=True)
+    assert [] == customer.validate(collect=True)
+    customer.validate()
+
+
+def test_validation_error_message_is_rendered_lazily():
+
+    rendered = []
+
+    class Allowed(object):
+
+        def __init__(self, name):
+            self.name = name
+
+        def __str__(self):
+            rendered.append(self.name)
+            return self.name
+
+    validator = validators.Value([Allowed('first'), Allowed('second')])
+    with pytest.raises(errors.ValidationError) as info:
+        validator.validate('third')
+    assert [] == rendered
+    assert 'not_allowed' == info.value.code
+    assert 'third' == info.value.value
+    assert (
+        "Value 'third' is not an allowed value. It should be equal to one "
+        "of the following values: 'first, second'." == str(info.value))
+    assert ['first', 'second'] == rendered
+
+    field = fields.IntField()
+    with pytest.raises(errors.ValidationError) as info:
+        field.validate('42')
+    assert 'wrong_type' == info.value.code
+    assert field is info.value.field
+    assert (int,) == info.value.params['types']
+    assert "('Value is wrong, expected type \"int\"', '42')" == str(
+        info.value)
+
+    restored = pickle.loads(pickle.dumps(info.value))
+    assert str(info.value) == str(restored)
+    assert 'wrong_type' == restored.code
+    assert restored.field is None
+
+    assert 'Some message.' == str(errors.ValidationError('Some message.'))
+
+
+def test_validation_error_with_assigned_args():
+
+    field = fields.IntField(required=True)
+    with pytest.raises(errors.ValidationError) as info:
+        field.validate(None)
+    error = info.value
+    error.args = ('Context: ' + error.args[0],) + error.args[1:]
+    assert ('Context: Field is required!',) == error.args
+    assert 'Context: Field is required!' == str(error)
+    assert error.code is None
@@ -0,0 +1,188 @@
+import datetime
+
+import pytest
+
+from jsonmodels import models, fields, errors, views
+
+
+class Item(models.Base):
+
+    name = fields.StringField(required=True)
+
+
+class Order(models.Base):
+
+    number = fields.IntField(required=True)
+    date = fields.DateField()
+    item = fields.EmbeddedField(Item)
+    items = fields.ListField(Item)
+
+
+def test_view():
+
+    parsed = []
+
+    class Event(models.Base):
+
+        name = fields.StringField(validators=parsed.append)
+        date = fields.DateField()
+
+    view = views.ModelView(Event, {'name': 'party', 'date': '2014-05-07'})
+    assert [] == parsed
+    assert 'party' == view.name
+    assert 'party' == view.name
+    assert ['party'] == parsed
+    assert datetime.date(2014, 5, 7) == view.date
+
+    view.validate()
+    assert isinstance(view.to_model(), Event)
+    assert {'name': 'party', 'date': datetime.date(2014, 5, 7)} == (
+        view.to_struct())
+
+    with pytest.raises(AttributeError):
+        view.name = 'other'
+    with pytest.raises(AttributeError):
+        del view.name
+    with pytest.raises(AttributeError):
+        view.unknown
+
+
+def test_view_validates_accessed_fields_only():
+
+    view = views.ModelView(Order, {'number': 'one', 'items': [{}]})
+
+    assert 1 == len(view.items)
+    assert isinstance(view.items[0], Item)
+    assert view.item is None
+    with pytest.raises(errors.ValidationError):
+        view.number
+    with pytest.raises(errors.ValidationError):
+        view.validate()
+
+    with pytest.raises(errors.ValidationError):
+        views.ModelView(Order, [])
+
+
+def _write_orders(path, text):
+    path.write_binary(text.encode('utf-8'))
+    return str(path)
+
+
+@pytest.mark.parametrize('text', [
+    u'{"number": 1, "item": {"name": "ż"}}\n'
+    u'\n'
+    u'{"number": 2, "date": "2014-05-07"}\n'
+    u'{"number": "three"}',
+    u'  {"number": 1, "item": {"name": "ż"}}\r\n'
+    u' \t\r\n'
+    u'\t{"number": 2, "date": "2014-05-07"}\r\n'
+    u' {"number": "three"} ',
+    u' [{"number": 1, "item": {"name": "ż"}},\n'
+    u'  {"number": 2, "date": "2014-05-07"}, {"number": "three"}]\n',
+])
+def test_mapped_records(tmpdir, text):
+
+    path = _write_orders(tmpdir.join('orders.json'), text)
+    with Order.map_file(path) as records:
+        assert 3 == len(records)
+
+        assert 1 == records[0].number
+        assert u'ż' == records[0].item.name
+        assert datetime.date(2014, 5, 7) == records[1].date
+        assert 2 == records[-2].number
+        with pytest.raises(errors.ValidationError):
+            records[2].number
+        with pytest.raises(IndexError):
+            records[3]
+        with pytest.raises(IndexError):
+            records[-4]
+
+        assert [1, 2] == [record.number for record in list(records)[:2]]
+
+
+def test_mapped_empty_files(tmpdir):
+
+    for text in [u'', u'\n', u'[]']:
+        path = _write_orders(tmpdir.join('orders.json'), text)
+        with Order.map_file(path) as records:
+            assert 0 == len(records)
+
+    path = _write_orders(tmpdir.join('orders.json'), u'[{"number": 1},')
+    with pytest.raises(ValueError):
+        Order.map_file(path)
+
+
+def test_model_view():
+
+    parsed = []
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True, validators=parsed.append)
+        surname = fields.StringField(validators=parsed.append)
+
+    class Team(models.Base):
+
+        leader = fields.EmbeddedField(Person)
+        checked_leader = fields.EmbeddedField(
+            Person, validators=parsed.append)
+        members = fields.ListField(Person)
+
+    data = {
+        'leader': {'name': 'Alan', 'surname': 'Wake'},
+        'checked_leader': {'name': 'Bob'},
+        'members': [{'name': 'Eve'}],
+    }
+    team = Team.view(data)
+    assert isinstance(team, views.ModelView)
+
+    assert isinstance(team.leader, views.ModelView)
+    assert [] == parsed
+    assert 'Wake' == team.leader.surname
+    assert ['Wake'] == parsed
+
+    assert isinstance(team.checked_leader, Person)
+    assert 'Eve' == team.members[0].name
+
+    team.validate()
+    assert Team(**data).to_struct() == team.to_struct()
+
+
+def test_model_view_validation():
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True)
+        age = fields.IntField()
+
+    class Team(models.Base):
+
+        leader = fields.EmbeddedField(Person, required=True)
+
+    team = Team.view({'leader': {'age': 'old'}})
+    leader = team.leader
+    with pytest.raises(errors.ValidationError):
+        leader.age
+    with pytest.raises(errors.ValidationError):
+        team.validate()
+
+    team = Team.view({'leader': {'name': 'Alan', 'age': 40}})
+    team.validate()
+    team.validate()
+
+    with pytest.raises(errors.ValidationError):
+        Team.view({}).validate()
+    with pytest.raises(errors.ValidationError):
+        Team.view({'leader': 'Alan'}).leader
+
+
+def test_model_view_after_fields_change():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    assert 'Alan' == Person.view({'name': 'Alan'}).name
+
+    Person.surname = fields.StringField()
+    assert 'Wake' == Person.view({'name': 'Alan', 'surname': 'Wake'}).surname